@@ -19,18 +19,23 @@ from bmad_dash import (
 )
 
 
+def init_test_repo(repo_path):
+    """Initialize a git repo with test user config in a single config write."""
+    repo_path.mkdir(parents=True, exist_ok=True)
+    repo = Repo.init(repo_path)
+    with repo.config_writer() as cw:
+        cw.set_value("user", "name", "Test User")
+        cw.set_value("user", "email", "test@test.com")
+    return repo
+
+
 @pytest.fixture
 def temp_repo():
     """Create a temporary BMAD repository for testing."""
     with tempfile.TemporaryDirectory() as tmpdir:
         repo_path = Path(tmpdir) / "test-repo"
-        repo_path.mkdir()
-        
-        # Initialize git repo
-        repo = Repo.init(repo_path)
-        repo.config_writer().set_value("user", "name", "Test User").release()
-        repo.config_writer().set_value("user", "email", "test@test.com").release()
-        
+        repo = init_test_repo(repo_path)
+
         # Create feature structure
         feature_path = repo_path / "features" / "auth" / "stories" / "login"
         feature_path.mkdir(parents=True)
@@ -61,8 +66,9 @@ User authentication feature.
         log_file = logs_dir / "latest.log"
         log_file.write_text("2025-11-04 10:00:00 - INFO - Test log\n")
         
-        # Commit
-        repo.index.add([str(p.relative_to(repo_path)) for p in [state_file, prd_file, design_file, log_file]])
+        # Commit (precompute relative path strings once)
+        root = str(repo_path)
+        repo.index.add([os.path.relpath(str(p), root) for p in [state_file, prd_file, design_file, log_file]])
         repo.index.commit("Initial commit")
         
         yield repo_path
@@ -204,21 +210,19 @@ class TestMultipleRepos:
             repo2_path = Path(tmpdir) / "repo2"
             
             for repo_path in [repo1_path, repo2_path]:
-                repo_path.mkdir()
-                repo = Repo.init(repo_path)
-                repo.config_writer().set_value("user", "name", "Test").release()
-                repo.config_writer().set_value("user", "email", "test@test.com").release()
-                
+                repo = init_test_repo(repo_path)
+
                 feature_path = repo_path / "features" / "test" / "stories" / "story1"
                 feature_path.mkdir(parents=True)
-                
+
                 state_file = feature_path / "state.yaml"
                 state_file.write_text(yaml.dump({"state": "Draft"}))
-                
+
                 prd_file = feature_path / "PRD.md"
                 prd_file.write_text("# Test\n\n## Acceptance Criteria\nTest")
-                
-                repo.index.add([str(state_file.relative_to(repo_path)), str(prd_file.relative_to(repo_path))])
+
+                root = str(repo_path)
+                repo.index.add([os.path.relpath(str(state_file), root), os.path.relpath(str(prd_file), root)])
                 repo.index.commit("Initial")
             
             parser = BMADParser([str(repo1_path), str(repo2_path)])
@@ -7,6 +7,29 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 
+# Status markers for milestone classification, hoisted so the per-line
+# classifier does not rebuild the candidate lists on every call
+DONE_MARKERS = ("✅", "✓", "Complete", "Done")
+IN_PROGRESS_MARKERS = ("🔄", "In Progress", "Active")
+
+# Section keywords the extraction regexes care about; once a document has
+# yielded all of them there is no point reading further. Each entry is a
+# tuple of accepted header spellings. IN and OUT scope are tracked as
+# separate entries: documents list both, and stopping on whichever scope
+# header appears first would drop the other
+NEEDED_SECTIONS = (
+    ("strategic overview",),
+    ("problem statement",),
+    ("product concept",),
+    ("key milestones",),
+    ("implementation timeline",),
+    ("story map",),
+    ("success criteria",),
+    ("in scope",),
+    ("out of scope", "out scope"),
+)
+
+
 @dataclass
 class Milestone:
     """Represents a project milestone."""
@@ -69,12 +92,51 @@ class VisionParser:
             scope_out=vision_data.get("scope_out", [])
         )
     
+    def _iter_sections(self, file_path: Path):
+        """Yield (header, body_lines) per '## ' section, reading line-by-line."""
+        header = None
+        body = []
+        with open(file_path, "r", buffering=65536) as fh:
+            for line in fh:
+                if line.startswith("## "):
+                    if header is not None or body:
+                        yield header, body
+                    header = line
+                    body = []
+                else:
+                    body.append(line)
+        if header is not None or body:
+            yield header, body
+
+    def _read_vision_content(self, file_path: Path) -> str:
+        """Stream a vision file, stopping once every needed section was read."""
+        needed = set(NEEDED_SECTIONS)
+        parts = []
+        for header, body in self._iter_sections(file_path):
+            if header is not None:
+                parts.append(header)
+                lowered = header.lower()
+                needed.difference_update(
+                    k for k in tuple(needed)
+                    if any(alt in lowered for alt in k)
+                )
+            parts.extend(body)
+            if not needed:
+                break
+        return "".join(parts)
+
     def _parse_vision_file(self, file_path: Path) -> Dict:
         """Parse a single vision file."""
-        content = file_path.read_text()
-        
+        content = self._read_vision_content(file_path)
+
         data = {}
-        
+
+        # Dispatch on file type so epics-only or MVP-only projects skip
+        # the full-document regex scans that cannot match their files
+        name = file_path.name
+        has_brief = name.startswith("product-brief")
+        has_mvp = name.startswith(("MVP_", "PRD_"))
+
         # Extract goal/problem statement
         goal_patterns = [
             r"##\s+(?:Strategic Overview|Problem Statement|Product Concept)\s*\n\s*(?:\*\*Product Concept:\*\*\s*\n\s*)?(.*?)(?=\n##|\Z)",
@@ -82,7 +144,7 @@ class VisionParser:
             r"##\s+🎯\s+Strategic Overview\s*\n\s*(?:\*\*Product Concept:\*\*\s*\n\s*)?(.*?)(?=\n##|\Z)"
         ]
         
-        for pattern in goal_patterns:
+        for pattern in goal_patterns if (has_brief or has_mvp) else []:
             match = re.search(pattern, content, re.DOTALL)
             if match:
                 goal_text = match.group(1).strip()
@@ -109,8 +171,8 @@ class VisionParser:
                 # Extract individual milestones
                 milestone_lines = re.findall(r'[✅✓🔄⏳📝❌]\s+(.+?)(?:\(|:|\n)', milestone_text)
                 for line in milestone_lines:
-                    status = "Done" if any(x in line for x in ["✅", "✓", "Complete", "Done"]) else \
-                             "In Progress" if any(x in line for x in ["🔄", "In Progress", "Active"]) else \
+                    status = "Done" if any(x in line for x in DONE_MARKERS) else \
+                             "In Progress" if any(x in line for x in IN_PROGRESS_MARKERS) else \
                              "Not Started"
                     milestones.append(Milestone(
                         name=line.strip(),
@@ -123,13 +185,30 @@ class VisionParser:
             story_map_match = re.search(r"##\s+Story Map\s*\n```(.*?)```", content, re.DOTALL)
             if story_map_match:
                 story_map = story_map_match.group(1)
-                # Extract stories from tree
-                story_lines = re.findall(r'[├└│]\s*(?:Story\s+\d+|─+)\s*(.+)', story_map)
-                for line in story_lines[:5]:  # Limit to 5
+                # Extract stories from tree (line scan is cheaper and more
+                # robust than a Unicode regex against box-drawing chars)
+                for raw_line in story_map.splitlines():
+                    line = raw_line.lstrip()
+                    if not line.startswith(("├", "└", "│")):
+                        continue
+                    body = line.lstrip("├└│ ")
+                    if body.startswith("─"):
+                        label = body.lstrip("─ ")
+                    elif body.startswith("Story"):
+                        parts = body.split(None, 2)
+                        if len(parts) < 3 or not parts[1].isdigit():
+                            continue
+                        label = parts[2]
+                    else:
+                        continue
+                    if not label:
+                        continue
                     milestones.append(Milestone(
-                        name=line.strip(),
+                        name=label.strip(),
                         status="Not Started"
                     ))
+                    if len(milestones) >= 5:  # Limit to 5
+                        break
             else:
                 # Try simple ## Story pattern with Status
                 story_matches = re.findall(r"##\s+(?:Story\s+\d+:|Epic\s+\d+:)?\s*(.+?)\n(?:.*?Status:\s*(\w+[^\n]*))?", content, re.DOTALL)
@@ -142,9 +221,9 @@ class VisionParser:
         
         data["milestones"] = milestones
         
-        # Extract success criteria
+        # Extract success criteria (MVP docs only)
         success_criteria = []
-        success_match = re.search(r"##\s+(?:MVP\s+)?Success Criteria\s*\n(.*?)(?=\n##|\Z)", content, re.DOTALL)
+        success_match = has_mvp and re.search(r"##\s+(?:MVP\s+)?Success Criteria\s*\n(.*?)(?=\n##|\Z)", content, re.DOTALL)
         if success_match:
             criteria_text = success_match.group(1)
             criteria_lines = re.findall(r'(?:✅|\d+\.)\s+(.+)', criteria_text)
@@ -152,21 +231,22 @@ class VisionParser:
         
         data["success_criteria"] = success_criteria
         
-        # Extract scope
+        # Extract scope (briefs and MVP docs only)
         scope_in = []
         scope_out = []
-        
-        scope_in_match = re.search(r"(?:###\s+)?(?:✅\s+)?What'?s\s+IN\s+Scope\s*\n(.*?)(?=\n###|\n##|\Z)", content, re.DOTALL | re.IGNORECASE)
-        if scope_in_match:
-            scope_text = scope_in_match.group(1)
-            scope_lines = re.findall(r'(?:[-•*]|\d+\.)\s+(.+)', scope_text)
-            scope_in = [s.strip() for s in scope_lines[:5]]
-        
-        scope_out_match = re.search(r"(?:###\s+)?(?:❌\s+)?What'?s\s+OUT\s+(?:of\s+)?Scope\s*\n(.*?)(?=\n###|\n##|\Z)", content, re.DOTALL | re.IGNORECASE)
-        if scope_out_match:
-            scope_text = scope_out_match.group(1)
-            scope_lines = re.findall(r'(?:[-•*]|\d+\.)\s+(.+)', scope_text)
-            scope_out = [s.strip() for s in scope_lines[:5]]
+
+        if has_brief or has_mvp:
+            scope_in_match = re.search(r"(?:###\s+)?(?:✅\s+)?What'?s\s+IN\s+Scope\s*\n(.*?)(?=\n###|\n##|\Z)", content, re.DOTALL | re.IGNORECASE)
+            if scope_in_match:
+                scope_text = scope_in_match.group(1)
+                scope_lines = re.findall(r'(?:[-•*]|\d+\.)\s+(.+)', scope_text)
+                scope_in = [s.strip() for s in scope_lines[:5]]
+
+            scope_out_match = re.search(r"(?:###\s+)?(?:❌\s+)?What'?s\s+OUT\s+(?:of\s+)?Scope\s*\n(.*?)(?=\n###|\n##|\Z)", content, re.DOTALL | re.IGNORECASE)
+            if scope_out_match:
+                scope_text = scope_out_match.group(1)
+                scope_lines = re.findall(r'(?:[-•*]|\d+\.)\s+(.+)', scope_text)
+                scope_out = [s.strip() for s in scope_lines[:5]]
         
         data["scope_in"] = scope_in
         data["scope_out"] = scope_out
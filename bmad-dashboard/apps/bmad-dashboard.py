@@ -4,16 +4,34 @@ BMAD Dashboard TUI
 Real-time visualization of BMAD project state with activity heatmap and next actions.
 """
 
+import fnmatch
+import functools
+import importlib.util
 import json
 import os
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+# Optional C-based JSON parser; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional filesystem-event support; trigger-file polling is the fallback
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
 # Check for rich library
 try:
     from rich.console import Console
@@ -61,9 +79,14 @@ STATE_ICONS = {
     "DONE": "✅",
 }
 
+# Precomputed style strings so hot label construction never formats or
+# re-parses styles at render time
+_STORY_STYLES = {activity: f"bold {color}" for activity, color in ACTIVITY_COLORS.items()}
+
 
+@functools.lru_cache(maxsize=1)
 def get_state_reader_path() -> Path:
-    """Get path to bmad-state-reader.py tool."""
+    """Get path to bmad-state-reader.py tool (cached; it never moves)."""
     home = Path.home()
     tool_path = home / ".config" / "claude-code" / "tools" / "bmad-state-reader.py"
 
@@ -73,9 +96,47 @@ def get_state_reader_path() -> Path:
     return tool_path
 
 
+# Loaded state reader module, cached for the lifetime of the process
+_state_reader_module = None
+
+
+def _load_state_reader_module():
+    """Load bmad-state-reader.py as a module, caching it after first import."""
+    global _state_reader_module
+    if _state_reader_module is None:
+        tool_path = get_state_reader_path()
+        spec = importlib.util.spec_from_file_location("bmad_state_reader", tool_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _state_reader_module = module
+    return _state_reader_module
+
+
 def read_bmad_state(project_path: Optional[str] = None) -> Dict[str, Any]:
     """
-    Call bmad-state-reader.py to get project state.
+    Get project state by calling the state reader in-process.
+
+    Avoids a fork+exec+JSON round trip on every refresh. Set
+    BMAD_DASHBOARD_SUBPROCESS=1 to force the old subprocess path for
+    isolation.
+
+    Raises:
+        BMADStateError: If state reader fails or returns invalid data
+        FileNotFoundError: If state reader tool is not found
+    """
+    if os.environ.get("BMAD_DASHBOARD_SUBPROCESS") == "1":
+        return _read_bmad_state_subprocess(project_path)
+
+    module = _load_state_reader_module()
+    try:
+        return module.get_bmad_state(Path(project_path) if project_path else None)
+    except Exception as e:
+        raise BMADStateError(f"Failed to read state: {e}") from e
+
+
+def _read_bmad_state_subprocess(project_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Call bmad-state-reader.py in a subprocess to get project state.
 
     Raises:
         BMADStateError: If state reader fails or returns invalid data
@@ -88,25 +149,45 @@ def read_bmad_state(project_path: Optional[str] = None) -> Dict[str, Any]:
         cmd.extend(["--path", project_path])
 
     try:
+        # Keep output as bytes so orjson can parse without an extra decode
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             check=True,
             timeout=30  # 30 second timeout to prevent indefinite hangs
         )
 
+        if orjson is not None:
+            return orjson.loads(result.stdout)
         return json.loads(result.stdout)
     except subprocess.TimeoutExpired:
         raise BMADStateError("State reader timed out after 30 seconds. Check for slow filesystem or very large projects.")
     except subprocess.CalledProcessError as e:
-        raise BMADStateError(f"Failed to read state: {e.stderr}") from e
+        stderr = e.stderr.decode("utf-8", "replace") if e.stderr else ""
+        raise BMADStateError(f"Failed to read state: {stderr}") from e
     except json.JSONDecodeError as e:
         raise BMADStateError(f"Invalid JSON from state reader: {e}") from e
     except OSError as e:
         raise BMADStateError(f"OS error occurred: {e}") from e
 
 
+# Built subtrees keyed by a cheap content hash, so unchanged buckets skip
+# reconstructing their Text objects on every tick
+_story_tree_cache: Dict[str, tuple] = {}
+_artifact_tree_cache: Dict[str, tuple] = {}
+
+
+def _story_bucket_signature(story_list: List[Dict]) -> int:
+    """Hash the fields of a story bucket that affect its rendering."""
+    return hash(tuple(
+        (
+            s.get("id"), s.get("mtime"), s.get("status"), s.get("activity"),
+            s.get("title"), s.get("file"), tuple(s.get("next_actions") or ()),
+        )
+        for s in story_list
+    ))
+
+
 def build_story_tree(stories: Dict[str, List], console: Console) -> Tree:
     """
     Build a rich Tree showing stories organized by state.
@@ -126,7 +207,16 @@ def build_story_tree(stories: Dict[str, List], console: Console) -> Tree:
             root.add(f"{state_label} [dim]- empty[/dim]")
             continue
 
-        state_node = root.add(state_label)
+        # Reuse the cached subtree when this bucket hasn't changed
+        sig = _story_bucket_signature(story_list)
+        cached = _story_tree_cache.get(state)
+        if cached is not None and cached[0] == sig:
+            root.children.append(cached[1])
+            continue
+
+        state_node = Tree(state_label)
+        root.children.append(state_node)
+        _story_tree_cache[state] = (sig, state_node)
 
         # Add each story
         for story in story_list:
@@ -139,28 +229,27 @@ def build_story_tree(stories: Dict[str, List], console: Console) -> Tree:
             activity_icon = ACTIVITY_ICONS.get(activity, "⚪")
             color = ACTIVITY_COLORS.get(activity, "white")
 
-            # Story label
-            story_label = Text()
-            story_label.append(f"[{state}] ", style="dim")
-            story_label.append(f"Story {story_id}: {title}", style=f"bold {color}")
-            story_label.append(f" {activity_icon}")
+            # Story label, assembled in one call with a precomputed style
+            # (markup parsing would choke on bracketed state names/titles)
+            story_label = Text.assemble(
+                (f"[{state}] ", "dim"),
+                (f"Story {story_id}: {title}", _STORY_STYLES.get(activity, "bold white")),
+                f" {activity_icon}",
+            )
 
             story_node = state_node.add(story_label)
 
             # Add file info if available
             story_file = story.get("file")
             if story_file:
-                file_text = Text()
-                file_text.append("📄 ", style="dim")
-                file_text.append(story_file, style=f"{color}")
-                story_node.add(file_text)
+                story_node.add(Text.assemble(("📄 ", "dim"), (story_file, color)))
 
             # Add next actions
             if next_actions:
-                actions_text = Text()
-                actions_text.append("▶ ", style="bright_cyan")
-                actions_text.append(", ".join(next_actions), style="cyan")
-                story_node.add(actions_text)
+                story_node.add(Text.assemble(
+                    ("▶ ", "bright_cyan"),
+                    (", ".join(next_actions), "cyan"),
+                ))
 
     return root
 
@@ -183,9 +272,17 @@ def build_artifacts_tree(artifacts: List[Dict], console: Console) -> Tree:
             by_type[artifact_type] = []
         by_type[artifact_type].append(artifact)
 
-    # Add each type
+    # Add each type, reusing cached subtrees for unchanged groups
     for artifact_type, items in sorted(by_type.items()):
-        type_node = root.add(f"[bold]{artifact_type}[/bold] ({len(items)})")
+        sig = hash(tuple((i.get("file"), i.get("mtime"), i.get("activity")) for i in items))
+        cached = _artifact_tree_cache.get(artifact_type)
+        if cached is not None and cached[0] == sig:
+            root.children.append(cached[1])
+            continue
+
+        type_node = Tree(f"[bold]{artifact_type}[/bold] ({len(items)})")
+        root.children.append(type_node)
+        _artifact_tree_cache[artifact_type] = (sig, type_node)
 
         for item in items:
             file_path = item.get("file", "?")
@@ -193,12 +290,11 @@ def build_artifacts_tree(artifacts: List[Dict], console: Console) -> Tree:
             activity_icon = ACTIVITY_ICONS.get(activity, "⚪")
             color = ACTIVITY_COLORS.get(activity, "white")
 
-            file_text = Text()
-            file_text.append("📄 ", style="dim")
-            file_text.append(file_path, style=color)
-            file_text.append(f" {activity_icon}")
-
-            type_node.add(file_text)
+            type_node.add(Text.assemble(
+                ("📄 ", "dim"),
+                (file_path, color),
+                f" {activity_icon}",
+            ))
 
     return root
 
@@ -297,6 +393,65 @@ def build_dashboard(state: Dict[str, Any], console: Console) -> Layout:
     return layout
 
 
+# Filenames whose changes should refresh the dashboard
+_WATCH_PATTERNS = ("*.story.md", "story-*.md", "bmm-workflow-status.md",
+                   "*.md", "*.xml", "*.yaml")
+
+
+class _RefreshHandler(FileSystemEventHandler):
+    """Sets an event when a file the dashboard renders from changes."""
+
+    def __init__(self, refresh_event: threading.Event):
+        self._refresh_event = refresh_event
+
+    def on_any_event(self, event):
+        if getattr(event, "is_directory", False):
+            return
+        name = os.path.basename(getattr(event, "src_path", "") or "")
+        if any(fnmatch.fnmatch(name, pattern) for pattern in _WATCH_PATTERNS):
+            self._refresh_event.set()
+
+
+def _start_observer(project_root: Optional[str], refresh_event: threading.Event):
+    """
+    Watch project_root for source-file changes when watchdog is available.
+
+    Returns the running observer, or None when watchdog is not installed
+    (the caller then relies on trigger-file polling alone).
+    """
+    if Observer is None or not project_root:
+        return None
+
+    try:
+        observer = Observer()
+        observer.schedule(_RefreshHandler(refresh_event), project_root, recursive=True)
+        observer.start()
+        return observer
+    except OSError:
+        return None
+
+
+def _state_signature(state: Dict[str, Any]) -> int:
+    """
+    Cheap hash over the fields that affect rendering, built from data the
+    state reader already gathered (no extra I/O).
+    """
+    stories = state.get("stories") or {}
+    artifacts = state.get("artifacts") or []
+    return hash((
+        state.get("error"),
+        tuple(sorted((state.get("project") or {}).items())),
+        tuple(
+            (state_name, _story_bucket_signature(bucket))
+            for state_name, bucket in stories.items()
+        ),
+        tuple(
+            (a.get("file"), a.get("mtime"), a.get("type"), a.get("activity"))
+            for a in artifacts
+        ),
+    ))
+
+
 def check_trigger_file(trigger_path: Path, last_check: float) -> bool:
     """
     Check if trigger file has been modified since last check.
@@ -336,20 +491,46 @@ def run_dashboard(project_path: Optional[str] = None, poll_interval: float = 1.0
         console.print(f"\n[bold red]Error:[/bold red] {e}")
         return
 
-    with Live(build_dashboard(state, console), console=console, refresh_per_second=1) as live:
+    # Filesystem events refresh immediately when watchdog is installed;
+    # the trigger file keeps working either way (hooks touch it from outside
+    # the project tree)
+    refresh_event = threading.Event()
+    observer = _start_observer(state.get("project_root"), refresh_event)
+
+    # Rendered Layout cached per signature: ticks that come back to a
+    # previously seen state reuse the renderable without rebuilding it
+    last_sig = _state_signature(state)
+    layout_cache: Dict[int, Layout] = {last_sig: build_dashboard(state, console)}
+
+    with Live(layout_cache[last_sig], console=console, refresh_per_second=1) as live:
         try:
             while True:
-                time.sleep(poll_interval)
+                if observer is not None:
+                    # Wake immediately on filesystem events, else poll
+                    refresh_event.wait(timeout=poll_interval)
+                else:
+                    time.sleep(poll_interval)
 
                 # Check if we should refresh
-                should_refresh = check_trigger_file(trigger_path, last_trigger_check)
+                should_refresh = refresh_event.is_set() or check_trigger_file(trigger_path, last_trigger_check)
 
                 if should_refresh:
+                    refresh_event.clear()
                     try:
                         # Reload state
                         state = read_bmad_state(project_path)
-                        # Update display
-                        live.update(build_dashboard(state, console))
+                        # Only rebuild the display when something rendered
+                        # actually changed (spurious triggers are common)
+                        sig = _state_signature(state)
+                        if sig != last_sig:
+                            last_sig = sig
+                            layout = layout_cache.get(sig)
+                            if layout is None:
+                                layout = build_dashboard(state, console)
+                                if len(layout_cache) >= 8:
+                                    layout_cache.clear()
+                                layout_cache[sig] = layout
+                            live.update(layout)
                     except (BMADStateError, FileNotFoundError):
                         # Continue with last known state on errors during refresh
                         pass
@@ -359,6 +540,10 @@ def run_dashboard(project_path: Optional[str] = None, poll_interval: float = 1.0
 
         except KeyboardInterrupt:
             console.print("\n[yellow]Dashboard stopped by user[/yellow]")
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join(timeout=2)
 
 
 def print_static_summary(project_path: Optional[str] = None):
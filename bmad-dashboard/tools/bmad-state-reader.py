@@ -4,14 +4,60 @@ BMAD State Reader Tool
 Parses BMAD project structure and returns JSON with project state, stories, and artifacts.
 """
 
+import fnmatch
 import json
 import os
 import re
 import sys
-from datetime import datetime
+import time
+from bisect import bisect_right
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+# Optional C-based JSON emitter; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Byte patterns: the status file is matched without decoding it first;
+# only the small matched groups get decoded.
+# One alternation scanned in a single pass instead of nine re.search calls
+_KV_RE = re.compile(
+    rb"^(PROJECT_NAME|PROJECT_TYPE|PROJECT_LEVEL|FIELD_TYPE|START_DATE|"
+    rb"CURRENT_PHASE|CURRENT_WORKFLOW|CURRENT_AGENT|NEXT_ACTION):\s*(.+)$",
+    re.MULTILINE,
+)
+_KV_MAP = {
+    b"PROJECT_NAME": "name",
+    b"PROJECT_TYPE": "type",
+    b"PROJECT_LEVEL": "level",
+    b"FIELD_TYPE": "field_type",
+    b"START_DATE": "start_date",
+    b"CURRENT_PHASE": "current_phase",
+    b"CURRENT_WORKFLOW": "current_workflow",
+    b"CURRENT_AGENT": "current_agent",
+    b"NEXT_ACTION": "next_action",
+}
+
+# Story-state patterns, compiled once at module scope and anchored to
+# line starts so a malformed file cannot trigger mid-line rescans
+_SEQUENCE_RE = re.compile(rb'^STORIES_SEQUENCE:[ \t]*(\[.*?\])', re.MULTILINE)
+_TODO_STORY_RE = re.compile(rb'^TODO_STORY:[ \t]*(.+)', re.MULTILINE)
+_TODO_TITLE_RE = re.compile(rb'^TODO_TITLE:[ \t]*(.+)', re.MULTILINE)
+_PROGRESS_STORY_RE = re.compile(rb'^IN_PROGRESS_STORY:[ \t]*(\S+)', re.MULTILINE)
+_PROGRESS_TITLE_RE = re.compile(rb'^IN_PROGRESS_TITLE:[ \t]*(.+)', re.MULTILINE)
+_DONE_RE = re.compile(rb'^STORIES_DONE:[ \t]*(\[.*?\])', re.MULTILINE)
+_LEGACY_DONE_RE = re.compile(
+    "(?m)^\\s*-\\s+Story\\s+(\\d+):\\s+(.+?)\\s+(?:\\(\\d+\\s+points?\\))?\\s*-\\s*✅\\s*COMPLETE".encode("utf-8")
+)
+
+# Story-file header patterns, compiled once instead of per file
+_STORY_ID_RE = re.compile(r"story[- ](\d+\.\d+)", re.IGNORECASE)
+_STORY_TITLE_RE = re.compile(r"#\s+(?:Story\s+[\d.]+:\s+)?(.+)")
+_STORY_STATUS_RE = re.compile(r"Status:\s*(\w+)", re.IGNORECASE)
+
 
 def find_bmad_project_root(start_path: str = ".") -> Optional[Path]:
     """
@@ -41,39 +87,12 @@ def parse_workflow_status(status_file: Path) -> Dict[str, Any]:
     if not status_file.exists():
         return {}
 
-    content = status_file.read_text(encoding='utf-8', errors='replace')
+    content = status_file.read_bytes()
 
-    # Parse project configuration
+    # Parse project configuration, current state, and next action in one pass
     project = {}
-    config_patterns = {
-        "name": r"PROJECT_NAME:\s*(.+)",
-        "type": r"PROJECT_TYPE:\s*(.+)",
-        "level": r"PROJECT_LEVEL:\s*(.+)",
-        "field_type": r"FIELD_TYPE:\s*(.+)",
-        "start_date": r"START_DATE:\s*(.+)",
-    }
-
-    for key, pattern in config_patterns.items():
-        match = re.search(pattern, content)
-        if match:
-            project[key] = match.group(1).strip()
-
-    # Parse current state
-    state_patterns = {
-        "current_phase": r"CURRENT_PHASE:\s*(.+)",
-        "current_workflow": r"CURRENT_WORKFLOW:\s*(.+)",
-        "current_agent": r"CURRENT_AGENT:\s*(.+)",
-    }
-
-    for key, pattern in state_patterns.items():
-        match = re.search(pattern, content)
-        if match:
-            project[key] = match.group(1).strip()
-
-    # Parse next action
-    next_action_match = re.search(r"NEXT_ACTION:\s*(.+)", content)
-    if next_action_match:
-        project["next_action"] = next_action_match.group(1).strip()
+    for match in _KV_RE.finditer(content):
+        project[_KV_MAP[match.group(1)]] = match.group(2).strip().decode('utf-8', 'replace')
 
     # Parse story states from Development Queue format
     stories = {
@@ -84,7 +103,7 @@ def parse_workflow_status(status_file: Path) -> Dict[str, Any]:
     }
 
     # Parse STORIES_SEQUENCE for BACKLOG (JSON array format)
-    sequence_match = re.search(r'STORIES_SEQUENCE:\s*(\[.*?\])', content)
+    sequence_match = _SEQUENCE_RE.search(content)
     if sequence_match:
         try:
             sequence = json.loads(sequence_match.group(1))
@@ -101,12 +120,12 @@ def parse_workflow_status(status_file: Path) -> Dict[str, Any]:
             pass
 
     # Parse TODO_STORY and TODO_TITLE
-    todo_story_match = re.search(r'TODO_STORY:\s*(.+)', content)
-    todo_title_match = re.search(r'TODO_TITLE:\s*(.+)', content)
+    todo_story_match = _TODO_STORY_RE.search(content)
+    todo_title_match = _TODO_TITLE_RE.search(content)
     if todo_story_match:
-        story_id = todo_story_match.group(1).strip()
+        story_id = todo_story_match.group(1).strip().decode('utf-8', 'replace')
         if story_id:  # Only if not empty
-            title = todo_title_match.group(1).strip() if todo_title_match else story_id
+            title = todo_title_match.group(1).strip().decode('utf-8', 'replace') if todo_title_match else story_id
             stories["TODO"].append({
                 "id": story_id,
                 "title": title,
@@ -117,13 +136,13 @@ def parse_workflow_status(status_file: Path) -> Dict[str, Any]:
             stories["BACKLOG"] = [s for s in stories["BACKLOG"] if s["id"] != story_id]
 
     # Parse IN_PROGRESS_STORY and IN_PROGRESS_TITLE
-    progress_story_match = re.search(r'IN_PROGRESS_STORY:\s*(\S+)', content)
-    progress_title_match = re.search(r'IN_PROGRESS_TITLE:\s*(.+)', content)
+    progress_story_match = _PROGRESS_STORY_RE.search(content)
+    progress_title_match = _PROGRESS_TITLE_RE.search(content)
     if progress_story_match:
-        story_id = progress_story_match.group(1).strip()
+        story_id = progress_story_match.group(1).strip().decode('utf-8', 'replace')
         # Check if it's not empty and not another field name
         if story_id and not story_id.endswith(':'):
-            title = progress_title_match.group(1).strip() if progress_title_match else story_id
+            title = progress_title_match.group(1).strip().decode('utf-8', 'replace') if progress_title_match else story_id
             # Also check title is not empty or another field
             if title and not title.startswith('STORIES_') and not title.endswith(':'):
                 stories["IN PROGRESS"].append({
@@ -136,7 +155,7 @@ def parse_workflow_status(status_file: Path) -> Dict[str, Any]:
                 stories["BACKLOG"] = [s for s in stories["BACKLOG"] if s["id"] != story_id]
 
     # Parse STORIES_DONE (JSON array format)
-    done_match = re.search(r'STORIES_DONE:\s*(\[.*?\])', content)
+    done_match = _DONE_RE.search(content)
     if done_match:
         try:
             done_list = json.loads(done_match.group(1))
@@ -153,10 +172,9 @@ def parse_workflow_status(status_file: Path) -> Dict[str, Any]:
 
     # Also parse completed stories from Story Backlog section
     # Look for patterns like: "- Story X: Title ... ✅ COMPLETE"
-    backlog_pattern = r"-\s+Story\s+(\d+):\s+(.+?)\s+(?:\(\d+\s+points?\))?\s*-\s*✅\s*COMPLETE"
-    for match in re.finditer(backlog_pattern, content):
-        story_num = match.group(1)
-        title = match.group(2).strip()
+    for match in _LEGACY_DONE_RE.finditer(content):
+        story_num = match.group(1).decode('ascii')
+        title = match.group(2).strip().decode('utf-8', 'replace')
         # Don't add if already in DONE
         if not any(s.get("id") == story_num for s in stories["DONE"]):
             stories["DONE"].append({
@@ -172,17 +190,31 @@ def parse_workflow_status(status_file: Path) -> Dict[str, Any]:
     }
 
 
-def get_file_mtime(file_path: Path) -> Optional[float]:
-    """Get file modification time as Unix timestamp."""
+def get_entry_mtime(entry: os.DirEntry) -> Optional[float]:
+    """Get mtime from a DirEntry, reusing metadata cached by the scandir walk."""
     try:
-        return file_path.stat().st_mtime
+        return entry.stat(follow_symlinks=False).st_mtime
+    except OSError as e:
+        print(f"Warning: Cannot stat {entry.path}: {e}", file=sys.stderr)
+        return None
+
+
+def get_file_mtime(file_path) -> Optional[float]:
+    """Get file modification time as Unix timestamp. Accepts str or Path."""
+    try:
+        return os.stat(file_path).st_mtime
     except (OSError, IOError) as e:
         # File doesn't exist, no permissions, or other OS error
         print(f"Warning: Cannot stat {file_path}: {e}", file=sys.stderr)
         return None
 
 
-def get_time_ago_category(mtime: Optional[float]) -> str:
+# Age thresholds: 1 hour, 4 hours, 24 hours, 7 days, 30 days
+_AGE_THRESHOLDS = (3600, 14400, 86400, 604800, 2592000)
+_AGE_LABELS = ("recent", "hour", "day", "week", "month", "old")
+
+
+def get_time_ago_category(mtime: Optional[float], now: Optional[float] = None) -> str:
     """
     Categorize how long ago a file was modified.
     Returns: recent, hour, day, week, month, old, never
@@ -190,113 +222,246 @@ def get_time_ago_category(mtime: Optional[float]) -> str:
     if mtime is None:
         return "never"
 
-    now = datetime.now().timestamp()
-    age_seconds = now - mtime
-
-    # Define thresholds
-    if age_seconds < 3600:  # < 1 hour
-        return "recent"
-    elif age_seconds < 14400:  # < 4 hours
-        return "hour"
-    elif age_seconds < 86400:  # < 24 hours
-        return "day"
-    elif age_seconds < 604800:  # < 7 days
-        return "week"
-    elif age_seconds < 2592000:  # < 30 days
-        return "month"
-    else:
-        return "old"
+    if now is None:
+        now = time.time()
+
+    return _AGE_LABELS[bisect_right(_AGE_THRESHOLDS, now - mtime)]
+
+
+def assign_activity(items: List[Dict[str, Any]], now: Optional[float] = None) -> None:
+    """
+    Assign the activity bucket for each item's mtime in place.
+
+    Large lists are bucketed in one vectorized searchsorted when NumPy is
+    available; the scalar path avoids the import cost for small projects.
+    """
+    if now is None:
+        now = time.time()
+
+    if len(items) >= 64:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            mtimes = np.fromiter(
+                (item["mtime"] or 0.0 for item in items),
+                dtype=np.float64, count=len(items),
+            )
+            indices = np.searchsorted(
+                np.asarray(_AGE_THRESHOLDS, dtype=np.float64),
+                now - mtimes, side="right",
+            )
+            for item, idx in zip(items, indices):
+                item["activity"] = "never" if item["mtime"] is None else _AGE_LABELS[idx]
+            return
+
+    for item in items:
+        item["activity"] = get_time_ago_category(item["mtime"], now)
+
+
+# Story and artifact filename patterns, classified during one traversal
+_STORY_PATTERNS = ("*.story.md", "story-*.md")
+
+_ARTIFACT_PATTERNS = [
+    ("PRD", "PRD.md"),
+    ("Epics", "epics*.md"),
+    ("Architecture", "*architecture*.md"),  # More flexible pattern
+    ("Tech Spec", "tech-spec*.md"),
+    ("Game Design", "GDD.md"),
+    ("Product Brief", "product-brief.md"),
+    ("Game Brief", "game-brief.md"),
+    ("Story Context", "*context*.xml"),
+    ("Sprint Status", "sprint-status*.yaml"),
+    ("Completion Report", "*completion-report*.md"),  # New
+    ("Implementation Plan", "*implementation-plan*.md"),  # New
+    ("Planning Doc", "*plan*.md"),  # New
+]
+
+# The pattern tables compiled into single alternations: one regex match
+# classifies a basename instead of a per-pattern fnmatch loop. The group
+# index of an artifact match selects its type (first listed pattern wins).
+_STORY_NAME_RE = re.compile("|".join(fnmatch.translate(p) for p in _STORY_PATTERNS))
+_ARTIFACT_TYPES = tuple(t for t, _ in _ARTIFACT_PATTERNS)
+_ARTIFACT_NAME_RE = re.compile(
+    "|".join(f"({fnmatch.translate(p)})" for _, p in _ARTIFACT_PATTERNS)
+)
+
+
+# Vendor/build trees that never contain BMAD files; pruning them keeps the
+# walk proportional to project sources rather than dependency checkouts
+_SKIP_DIRS = frozenset({
+    ".git", "node_modules", ".venv", "venv", "__pycache__",
+    "dist", "build", ".mypy_cache", ".pytest_cache", "target", ".next",
+})
+
+# Hidden directories that legitimately hold BMAD content
+_ALLOWED_HIDDEN_DIRS = frozenset({".bmad", ".bmad-core", ".claude"})
+
+
+def _walk_files(root: Path):
+    """Yield os.DirEntry for every file under root via an os.scandir stack."""
+    stack = [str(root)]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            name = entry.name
+                            if name in _SKIP_DIRS or (
+                                name.startswith(".") and name not in _ALLOWED_HIDDEN_DIRS
+                            ):
+                                continue
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def scan_project_files(project_root: Path):
+    """
+    Walk the project tree once, classifying story files and artifacts.
+
+    Returns (story_entries, artifact_entries) where artifact_entries are
+    (artifact_type, entry) pairs. Replaces the separate rglob/glob passes
+    that each re-walked the whole tree.
+    """
+    story_entries = []
+    artifact_entries = []
 
+    for entry in _walk_files(project_root):
+        name = entry.name
+        if _STORY_NAME_RE.match(name):
+            story_entries.append(entry)
+        artifact_match = _ARTIFACT_NAME_RE.match(name)
+        if artifact_match:
+            artifact_entries.append((_ARTIFACT_TYPES[artifact_match.lastindex - 1], entry))
 
-def find_story_files(project_root: Path) -> List[Dict[str, Any]]:
+    return story_entries, artifact_entries
+
+
+# Parsed story files keyed by (path, mtime) so unchanged files skip
+# re-reading and regex work on every refresh
+_STORY_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+def find_story_files(project_root: Path, story_entries=None,
+                     now: Optional[float] = None) -> List[Dict[str, Any]]:
     """
     Find all story files (*.story.md and story-*.md) and extract metadata.
     """
     story_files = []
+    seen_keys = set()
+
+    if story_entries is None:
+        story_entries, _ = scan_project_files(project_root)
+
+    # Stay on raw path strings in the hot loop; Path construction per
+    # entry is pure overhead here
+    root_str = str(project_root)
+
+    for entry in story_entries:
+        story_file = entry.path
+        try:
+            # Modification time comes from the walk's cached DirEntry
+            # stat; fetch it first so unchanged files hit the cache
+            mtime = get_entry_mtime(entry)
+            cache_key = (story_file, mtime)
+            if mtime is not None and cache_key in _STORY_CACHE:
+                seen_keys.add(cache_key)
+                story_files.append(dict(_STORY_CACHE[cache_key]))
+                continue
+
+            # Headers live near the top; read and decode only the head
+            with open(story_file, 'rb') as f:
+                head = f.read(4096)
+            content = head.decode('utf-8', 'replace')
+            filename = entry.name
+
+            # Extract story ID from filename
+            # Try multiple patterns: story-1.2-title.md, story-comparison-tool-1.md, etc.
+            story_id = None
+
+            # Pattern 1: story-X.Y format
+            id_match = _STORY_ID_RE.search(filename)
+            if id_match:
+                story_id = id_match.group(1)
+            else:
+                # Pattern 2: story-{name}.md format (use filename without .md as ID)
+                if filename.startswith("story-") and filename.endswith(".md"):
+                    story_id = filename[:-3]  # Remove .md extension
+
+            # Extract title from first line (partition avoids splitting
+            # the whole head into a list)
+            first_line = content.partition("\n")[0]
+            title_match = _STORY_TITLE_RE.search(first_line)
+            title = title_match.group(1).strip() if title_match else filename
+
+            # Extract status; if the head was truncated and carried no
+            # Status marker, fall back to scanning the whole file once
+            status_match = _STORY_STATUS_RE.search(content)
+            if status_match is None and len(head) == 4096:
+                content = Path(story_file).read_text(encoding='utf-8', errors='replace')
+                status_match = _STORY_STATUS_RE.search(content)
+            status = status_match.group(1) if status_match else "unknown"
+
+            # Only add if we found a valid story ID
+            if story_id:
+                story = {
+                    "id": story_id,
+                    "title": title,
+                    "file": os.path.relpath(story_file, root_str),
+                    "status": status,
+                    "mtime": mtime,
+                    "activity": None,
+                }
+                if mtime is not None:
+                    seen_keys.add(cache_key)
+                    _STORY_CACHE[cache_key] = dict(story)
+                story_files.append(story)
+        except Exception as e:
+            print(f"Warning: Could not parse {story_file}: {e}", file=sys.stderr)
+
+    # Evict entries for files that changed or disappeared since last sweep
+    for key in list(_STORY_CACHE):
+        if key not in seen_keys:
+            del _STORY_CACHE[key]
 
-    # Search for both *.story.md and story-*.md files
-    patterns = ["*.story.md", "story-*.md"]
-
-    for pattern in patterns:
-        for story_file in project_root.rglob(pattern):
-            try:
-                content = story_file.read_text(encoding='utf-8', errors='replace')
-                filename = story_file.name
-
-                # Extract story ID from filename
-                # Try multiple patterns: story-1.2-title.md, story-comparison-tool-1.md, etc.
-                story_id = None
-
-                # Pattern 1: story-X.Y format
-                id_match = re.search(r"story[- ](\d+\.\d+)", filename, re.IGNORECASE)
-                if id_match:
-                    story_id = id_match.group(1)
-                else:
-                    # Pattern 2: story-{name}.md format (use filename without .md as ID)
-                    if filename.startswith("story-") and filename.endswith(".md"):
-                        story_id = filename[:-3]  # Remove .md extension
-
-                # Extract title from first line
-                first_line = content.split("\n")[0] if content else ""
-                title_match = re.search(r"#\s+(?:Story\s+[\d.]+:\s+)?(.+)", first_line)
-                title = title_match.group(1).strip() if title_match else filename
-
-                # Extract status
-                status_match = re.search(r"Status:\s*(\w+)", content, re.IGNORECASE)
-                status = status_match.group(1) if status_match else "unknown"
-
-                # Get modification time
-                mtime = get_file_mtime(story_file)
-
-                # Only add if we found a valid story ID
-                if story_id:
-                    story_files.append({
-                        "id": story_id,
-                        "title": title,
-                        "file": str(story_file.relative_to(project_root)),
-                        "status": status,
-                        "mtime": mtime,
-                        "activity": get_time_ago_category(mtime)
-                    })
-            except Exception as e:
-                print(f"Warning: Could not parse {story_file}: {e}", file=sys.stderr)
+    # Bucket all activities in one batch (vectorized for large lists)
+    assign_activity(story_files, now)
 
     return story_files
 
 
-def find_artifacts(project_root: Path) -> List[Dict[str, Any]]:
+def find_artifacts(project_root: Path, artifact_entries=None,
+                   now: Optional[float] = None) -> List[Dict[str, Any]]:
     """
     Find common BMAD artifacts (PRD, epics, architecture, tech specs, etc.)
     """
     artifacts = []
 
-    # Common artifact patterns
-    artifact_patterns = [
-        ("PRD", "**/PRD.md"),
-        ("Epics", "**/epics*.md"),
-        ("Architecture", "**/*architecture*.md"),  # More flexible pattern
-        ("Tech Spec", "**/tech-spec*.md"),
-        ("Game Design", "**/GDD.md"),
-        ("Product Brief", "**/product-brief.md"),
-        ("Game Brief", "**/game-brief.md"),
-        ("Story Context", "**/*context*.xml"),
-        ("Sprint Status", "**/sprint-status*.yaml"),
-        ("Completion Report", "**/*completion-report*.md"),  # New
-        ("Implementation Plan", "**/*implementation-plan*.md"),  # New
-        ("Planning Doc", "**/*plan*.md"),  # New
-    ]
-
-    for artifact_type, pattern in artifact_patterns:
-        for file_path in project_root.glob(pattern):
-            if file_path.is_file():
-                mtime = get_file_mtime(file_path)
-
-                artifacts.append({
-                    "type": artifact_type,
-                    "file": str(file_path.relative_to(project_root)),
-                    "mtime": mtime,
-                    "activity": get_time_ago_category(mtime)
-                })
+    if artifact_entries is None:
+        _, artifact_entries = scan_project_files(project_root)
+
+    root_str = str(project_root)
+
+    for artifact_type, entry in artifact_entries:
+        mtime = get_entry_mtime(entry)
+
+        artifacts.append({
+            "type": artifact_type,
+            "file": os.path.relpath(entry.path, root_str),
+            "mtime": mtime,
+            "activity": None,
+        })
+
+    # Bucket all activities in one batch (vectorized for large lists)
+    assign_activity(artifacts, now)
 
     return artifacts
 
@@ -344,37 +509,35 @@ def merge_story_data(status_stories: Dict[str, List], story_files: List[Dict[str
         for story in stories:
             story_id = story["id"]
 
-            # Merge with file data if available
-            if story_id in file_lookup:
-                file_data = file_lookup[story_id]
-                merged_story = {
-                    **story,
-                    "status": file_data["status"],
-                    "mtime": file_data["mtime"],
-                    "activity": file_data["activity"],
-                }
+            # Merge with file data if available; the story dicts are
+            # freshly built by parse_workflow_status, so mutate in place
+            # instead of copying each one through a dict splat
+            file_data = file_lookup.get(story_id)
+            if file_data is not None:
+                story["status"] = file_data["status"]
+                story["mtime"] = file_data["mtime"]
+                story["activity"] = file_data["activity"]
             else:
-                merged_story = {
-                    **story,
-                    "status": "unknown",
-                    "mtime": None,
-                    "activity": "never",
-                }
+                story["status"] = "unknown"
+                story["mtime"] = None
+                story["activity"] = "never"
 
             # Add next actions
-            merged_story["next_actions"] = infer_next_actions(
-                merged_story,
-                file_lookup.get(story_id)
-            )
+            story["next_actions"] = infer_next_actions(story, file_data)
 
-            merged[state].append(merged_story)
+            merged[state].append(story)
 
     return merged
 
 
-def get_bmad_state(project_root: Optional[Path] = None) -> Dict[str, Any]:
+def get_bmad_state(project_root: Optional[Path] = None,
+                   include_story_files: bool = False) -> Dict[str, Any]:
     """
     Main function to get complete BMAD project state.
+
+    Per-story data is already merged under stories[state]; the raw
+    story_files list is only included when explicitly requested, keeping
+    the payload small.
     """
     # Find project root if not provided
     if project_root is None:
@@ -392,22 +555,30 @@ def get_bmad_state(project_root: Optional[Path] = None) -> Dict[str, Any]:
     status_file = project_root / "bmm-workflow-status.md"
     status_data = parse_workflow_status(status_file)
 
+    # Snapshot the clock once; every activity bucket shares it
+    now = time.time()
+
+    # One traversal classifies both story files and artifacts
+    story_entries, artifact_entries = scan_project_files(project_root)
+
     # Find all story files
-    story_files = find_story_files(project_root)
+    story_files = find_story_files(project_root, story_entries, now)
 
     # Find artifacts
-    artifacts = find_artifacts(project_root)
+    artifacts = find_artifacts(project_root, artifact_entries, now)
 
     # Merge story data
     merged_stories = merge_story_data(status_data.get("stories", {}), story_files)
 
-    return {
+    state = {
         "project_root": str(project_root),
         "project": status_data.get("project", {}),
         "stories": merged_stories,
         "artifacts": artifacts,
-        "story_files": story_files,
     }
+    if include_story_files:
+        state["story_files"] = story_files
+    return state
 
 
 def main():
@@ -417,6 +588,8 @@ def main():
     parser = argparse.ArgumentParser(description="Parse BMAD project state")
     parser.add_argument("--path", help="Project root path (default: search from current dir)")
     parser.add_argument("--pretty", action="store_true", help="Pretty print JSON")
+    parser.add_argument("--include-story-files", action="store_true",
+                        help="Include the raw story_files list in the output")
 
     args = parser.parse_args()
 
@@ -424,11 +597,16 @@ def main():
     project_root = Path(args.path).resolve() if args.path else None
 
     # Get state
-    state = get_bmad_state(project_root)
+    state = get_bmad_state(project_root, include_story_files=args.include_story_files)
 
-    # Output JSON
-    indent = 2 if args.pretty else None
-    print(json.dumps(state, indent=indent, default=str))
+    # Output JSON (orjson serializes straight to bytes when available)
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if args.pretty else 0
+        sys.stdout.buffer.write(orjson.dumps(state, option=option, default=str))
+        sys.stdout.buffer.write(b"\n")
+    else:
+        indent = 2 if args.pretty else None
+        print(json.dumps(state, indent=indent, default=str))
 
 
 if __name__ == "__main__":
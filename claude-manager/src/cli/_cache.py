@@ -0,0 +1,82 @@
+"""Mtime-keyed cache for parsed registry metadata.
+
+Parsing every metadata.yaml on each CLI run dominates `list` and the
+load phase of `init`. The parsed item list is pickled under
+~/.cache/claude-seed/ keyed on the newest mtime in the registry tree,
+so unchanged registries load with a single pickle read.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import List
+
+from src.registry.models import RegistryItem
+
+
+# Bump when the pickled item layout changes so stale caches are discarded
+_CACHE_VERSION = 3
+
+
+def _cache_file(registry_path: str) -> Path:
+    """Return the cache file path for a registry location."""
+    key = hashlib.sha256(str(registry_path).encode()).hexdigest()[:16]
+    return Path.home() / ".cache" / "claude-seed" / f"registry-{key}.pkl"
+
+
+def _registry_max_mtime(registry_path: Path) -> int:
+    """Newest mtime (ns) across the registry tree.
+
+    Directory mtimes are included so file additions and removals
+    invalidate the cache even when no surviving file changed.
+    """
+    max_mtime = 0
+    for root, dirs, files in os.walk(registry_path):
+        for name in [""] + files:
+            try:
+                mtime = os.stat(os.path.join(root, name) if name else root).st_mtime_ns
+            except OSError:
+                continue
+            if mtime > max_mtime:
+                max_mtime = mtime
+    return max_mtime
+
+
+def cached_load_all(registry_path: str) -> List[RegistryItem]:
+    """Load all registry items, reusing a pickled result when unchanged.
+
+    Args:
+        registry_path: Path to registry directory
+
+    Returns:
+        List of all RegistryItem instances
+
+    Raises:
+        RegistryLoadError: If the registry is missing or invalid
+    """
+    from src.registry.loader import RegistryLoader
+
+    loader = RegistryLoader(registry_path)
+    cache_file = _cache_file(registry_path)
+    max_mtime = _registry_max_mtime(loader.registry_path)
+
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                version, cached_mtime, items = pickle.load(f)
+            if version == _CACHE_VERSION and cached_mtime == max_mtime:
+                return items
+        except Exception:
+            pass  # Corrupt or incompatible cache - fall through to real load
+
+    items = loader.load_all()
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump((_CACHE_VERSION, max_mtime, items), f)
+    except Exception:
+        pass  # Cache write failures must never break the command
+
+    return items
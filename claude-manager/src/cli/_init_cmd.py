@@ -0,0 +1,55 @@
+"""Click skeleton for the `init` subcommand, loaded on demand by LazyGroup."""
+
+import os
+
+import click
+
+
+@click.command()
+@click.option(
+    "--filter",
+    "-f",
+    multiple=True,
+    help="Filter items by tag (can be used multiple times)"
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Allow overwrites and ignore conflicts"
+)
+@click.option(
+    "--output",
+    "-o",
+    default=".claude",
+    help="Output directory for Claude Code files (default: .claude)"
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Preview changes without modifying files"
+)
+@click.option(
+    "--registry-path",
+    default=None,
+    show_default="~/.claude-registry",
+    help="Path to registry (default: ~/.claude-registry or $CLAUDE_REGISTRY_PATH)"
+)
+def init(filter, force, output, dry_run, registry_path):
+    """Initialize a new repository with selected registry items.
+
+    Interactive multi-select UI for choosing sub-agents, commands, and
+    MCP servers from the registry. Automatically resolves dependencies
+    and detects conflicts.
+
+    Examples:
+        claude-seed init
+        claude-seed init --filter research --filter prod-safe
+        claude-seed init --dry-run
+        claude-seed init --force --output .config/claude
+    """
+    # Resolved here rather than in the option default so module import
+    # never pays for expanduser's home-directory lookup
+    registry_path = (registry_path or os.environ.get("CLAUDE_REGISTRY_PATH")
+                     or os.path.expanduser("~/.claude-registry"))
+    from src.cli._init_core import run
+    run(filter, force, output, dry_run, registry_path)
@@ -0,0 +1,281 @@
+"""Core implementation of the `init` command.
+
+Imported lazily from src.cli.main so that `claude-seed --help` and
+`--version` never pay for the registry/selection/operations import graph.
+"""
+
+import os
+import sys
+
+import click
+
+from pathlib import Path
+from src.cli.main import (
+    EXIT_SUCCESS,
+    EXIT_USER_ERROR,
+    EXIT_SYSTEM_ERROR,
+    EXIT_CONFLICT,
+    EXIT_VALIDATION_ERROR,
+)
+from src.cli._cache import cached_load_all
+from src.registry.loader import RegistryLoadError
+from src.selection.filter import ItemFilter
+from src.selection.prompter import InteractivePrompter, SelectionCancelled
+from src.registry.resolver import DependencyResolver, DependencyError, CircularDependencyError
+from src.operations.copier import FileCopier, CopyError
+from src.operations.merger import JSONMerger, MergeError
+from src.operations.generator import EnvExampleGenerator, GeneratorError
+from src.operations.lockfile import LockFile, LockItem
+from src.validation.integrity import atomic_operation, FileOperation, AtomicOperationError
+from src.validation.schema import SchemaValidationError, _default_validator
+
+
+def run(filter, force, output, dry_run, registry_path):
+    """Execute the `init` workflow (see src.cli.main.init for the CLI docs)."""
+    click.echo("Initializing Claude Code repository...")
+    click.echo(f"Registry: {registry_path}")
+    click.echo(f"Output: {output}")
+
+    if dry_run:
+        click.echo("\n[DRY RUN] No files will be modified\n")
+
+    try:
+        # === SELECTION WORKFLOW ===
+
+        # 1. Load registry
+        click.echo("Loading registry...")
+        all_items = cached_load_all(registry_path)
+
+        if not all_items:
+            click.echo("Error: No items found in registry", err=True)
+            sys.exit(EXIT_USER_ERROR)
+
+        click.echo(f"  Found {len(all_items)} items")
+
+        # 2. Filter by tags if specified
+        filtered_items = all_items
+        if filter:
+            click.echo(f"Applying filters: {', '.join(filter)}")
+            filtered_items = ItemFilter.by_tags(filtered_items, list(filter))
+            click.echo(f"  {len(filtered_items)} items match filters")
+
+        if not filtered_items:
+            click.echo("Error: No items match the specified filters", err=True)
+            sys.exit(EXIT_USER_ERROR)
+
+        # 3. Interactive selection
+        click.echo("\nSelect items to install:")
+        try:
+            selected_items = InteractivePrompter.select_items(filtered_items)
+        except SelectionCancelled:
+            click.echo("\nSelection cancelled")
+            sys.exit(EXIT_SUCCESS)
+
+        if not selected_items:
+            click.echo("\nNo items selected - nothing to do")
+            sys.exit(EXIT_SUCCESS)
+
+        # 4. Resolve dependencies
+        click.echo("\nResolving dependencies...")
+        try:
+            resolved_items, dep_items = DependencyResolver.resolve_dependencies(
+                selected_items, all_items
+            )
+        except CircularDependencyError as e:
+            click.echo(f"\nError: {e}", err=True)
+            sys.exit(EXIT_VALIDATION_ERROR)
+        except DependencyError as e:
+            click.echo(f"\nError: {e}", err=True)
+            sys.exit(EXIT_USER_ERROR)
+
+        # Display summary
+        InteractivePrompter.display_summary(selected_items, dep_items)
+
+        # Collect all environment variables
+        required_env_vars = []
+        optional_env_vars = []
+        for item in resolved_items:
+            required_env_vars.extend(item.required_env_vars)
+            optional_env_vars.extend(item.optional_env_vars)
+
+        if required_env_vars or optional_env_vars:
+            InteractivePrompter.display_env_vars(required_env_vars, optional_env_vars)
+
+        # 5. Detect conflicts
+        click.echo("Detecting conflicts...")
+        mcp_items = [item for item in resolved_items if item.mcp_fragment]
+        mcp_fragments = JSONMerger.build_mcp_fragments(mcp_items)
+        conflicts = []
+
+        if mcp_fragments:
+            _, conflicts = JSONMerger.merge_with_item_names(
+                mcp_fragments, detect_conflicts=True
+            )
+
+        if conflicts:
+            InteractivePrompter.display_conflicts(conflicts)
+
+            if not force:
+                click.echo("Error: Conflicts detected. Use --force to override.", err=True)
+                sys.exit(EXIT_CONFLICT)
+            else:
+                click.echo("⚠️  Proceeding with --force (conflicts will be overwritten)")
+
+        # === DRY RUN MODE ===
+        if dry_run:
+            click.echo("\n" + "=" * 60)
+            click.echo("DRY RUN PREVIEW")
+            click.echo("=" * 60)
+
+            # Preview file operations
+            operations = FileCopier.preview_copy_operations(
+                resolved_items, Path(registry_path), Path(output)
+            )
+
+            click.echo(f"\nPlanned file operations ({len(operations)}):")
+            for op in operations:
+                click.echo(f"  CREATE {op['dest']} ({op['size']})")
+
+            # Preview .mcp.json
+            if mcp_items:
+                click.echo("\nMCP servers to configure:")
+                for item in mcp_items:
+                    click.echo(f"  - {item.name}")
+
+            # Preview .env.example
+            if required_env_vars or optional_env_vars:
+                click.echo("\nEnvironment variables:")
+                click.echo(f"  - Required: {len(required_env_vars)}")
+                click.echo(f"  - Optional: {len(optional_env_vars)}")
+
+            # Total size
+            total_size = FileCopier.get_total_size(resolved_items, Path(registry_path))
+            click.echo(f"\nTotal size: {FileCopier.format_size(total_size)}")
+
+            click.echo("\n" + "=" * 60)
+            sys.exit(EXIT_SUCCESS if not conflicts else EXIT_CONFLICT)
+
+        # === INSTALLATION WORKFLOW ===
+
+        click.echo("\nInstalling...")
+
+        # Check for existing .claude directory
+        output_path = Path(output)
+        if output_path.exists() and not force:
+            click.echo(f"Error: Directory '{output}' already exists. Use --force to overwrite.", err=True)
+            sys.exit(EXIT_SYSTEM_ERROR)
+
+        # Use atomic operation for installation
+        try:
+            with atomic_operation(output) as temp_dir:
+                # Copy files, streaming the lock hashes during the copy
+                # so nothing has to be read back afterwards
+                lock_file = LockFile.create_new(str(Path(registry_path).resolve()))
+
+                click.echo(f"  Copying files to {output}/...")
+                hashes = FileCopier.copy_all_items(
+                    resolved_items, Path(registry_path), temp_dir,
+                    collect_hashes=True, hash_algo=lock_file.hash_algo
+                )
+
+                # Merge and write .mcp.json
+                if mcp_items:
+                    click.echo("  Generating .mcp.json...")
+                    merged_mcp, _ = JSONMerger.merge_mcp_fragments(
+                        mcp_fragments, detect_conflicts=False
+                    )
+
+                    # Validate merged config
+                    is_valid, errors = _default_validator().validate(merged_mcp)
+                    if not is_valid:
+                        raise SchemaValidationError(
+                            f"Invalid MCP configuration: {'; '.join(errors)}"
+                        )
+
+                    # Write with deterministic formatting
+                    mcp_path = Path(".mcp.json")
+                    FileOperation.write_json(mcp_path, merged_mcp, sort_keys=True)
+
+                # Generate .env.example
+                if required_env_vars or optional_env_vars:
+                    click.echo("  Generating .env.example...")
+                    env_path = Path(".env.example")
+                    EnvExampleGenerator.generate(resolved_items, env_path)
+
+                # Generate lock file from the hashes collected above
+                click.echo("  Generating .claude.lock.json...")
+
+                # Stat everything under temp_dir with one scandir walk
+                # instead of a full path lookup per lock entry
+                stat_by_path = {}
+                temp_root = str(temp_dir)
+                stack = [temp_root]
+                while stack:
+                    with os.scandir(stack.pop()) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                rel = os.path.relpath(entry.path, temp_root)
+                                stat_by_path[rel] = entry.stat(follow_symlinks=False)
+
+                for item in resolved_items:
+                    file_hashes = {}
+                    for dest_path in item.files.keys():
+                        file_hash = hashes.get(str(dest_path))
+                        if file_hash is not None:
+                            # Record size/mtime so verify can stat-check
+                            # unchanged files instead of re-hashing them
+                            st = stat_by_path[str(dest_path)]
+                            file_hashes[dest_path] = {
+                                "hash": file_hash,
+                                "size": st.st_size,
+                                "mtime_ns": st.st_mtime_ns,
+                            }
+
+                    lock_item = LockItem(
+                        type=item.type,
+                        version=item.version,
+                        files=file_hashes
+                    )
+                    lock_file.add_item(item.name, lock_item)
+
+                lock_path = Path(".claude.lock.json")
+                FileOperation.write_json(lock_path, lock_file.to_dict(), sort_keys=True)
+
+        except AtomicOperationError as e:
+            click.echo(f"\nError during installation: {e}", err=True)
+            sys.exit(EXIT_SYSTEM_ERROR)
+        except (CopyError, MergeError, GeneratorError, SchemaValidationError) as e:
+            click.echo(f"\nError: {e}", err=True)
+            sys.exit(EXIT_SYSTEM_ERROR)
+
+        # Success!
+        click.echo("\n✓ Installation complete!")
+        click.echo("\nFiles created:")
+        click.echo(f"  - {output}/")
+        if mcp_items:
+            click.echo("  - .mcp.json")
+        if required_env_vars or optional_env_vars:
+            click.echo("  - .env.example")
+        click.echo("  - .claude.lock.json")
+
+        click.echo(f"\nInstalled {len(resolved_items)} items:")
+        for item in resolved_items:
+            prefix = "  ✓" if item in selected_items else "  +"
+            click.echo(f"{prefix} {item.name} v{item.version}")
+
+        if required_env_vars:
+            click.echo(f"\n⚠️  Remember to create .env and set {len(required_env_vars)} required variable(s)")
+
+        sys.exit(EXIT_SUCCESS)
+
+    except RegistryLoadError as e:
+        click.echo(f"Error loading registry: {e}", err=True)
+        sys.exit(EXIT_SYSTEM_ERROR)
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        if os.environ.get("CLAUDE_SEED_DEBUG"):
+            import traceback
+            traceback.print_exc()
+        sys.exit(EXIT_SYSTEM_ERROR)
@@ -0,0 +1,41 @@
+"""Click skeleton for the `install` subcommand, loaded on demand by LazyGroup."""
+
+import os
+
+import click
+
+
+@click.command()
+@click.option(
+    "--lock-file",
+    default=".claude.lock.json",
+    help="Path to lock file (default: .claude.lock.json)"
+)
+@click.option(
+    "--verify",
+    is_flag=True,
+    help="Verify file hashes after installation"
+)
+@click.option(
+    "--registry-path",
+    default=None,
+    show_default="~/.claude-registry",
+    help="Path to registry (default: ~/.claude-registry or $CLAUDE_REGISTRY_PATH)"
+)
+def install(lock_file, verify, registry_path):
+    """Install items from lock file for reproducible setup.
+
+    Reads the lock file and installs exact versions of items without
+    user interaction. Optionally verifies file hashes for integrity.
+
+    Examples:
+        claude-seed install
+        claude-seed install --verify
+        claude-seed install --lock-file custom-lock.json
+    """
+    # Resolved here rather than in the option default so module import
+    # never pays for expanduser's home-directory lookup
+    registry_path = (registry_path or os.environ.get("CLAUDE_REGISTRY_PATH")
+                     or os.path.expanduser("~/.claude-registry"))
+    from src.cli._install_core import run
+    run(lock_file, verify, registry_path)
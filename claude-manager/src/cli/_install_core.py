@@ -0,0 +1,253 @@
+"""Core implementation of the `install` command.
+
+Imported lazily from src.cli.main so that `claude-seed --help` and
+`--version` never pay for the registry/operations import graph.
+"""
+
+import os
+import sys
+
+import click
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from src.cli.main import (
+    EXIT_SUCCESS,
+    EXIT_USER_ERROR,
+    EXIT_SYSTEM_ERROR,
+    EXIT_VALIDATION_ERROR,
+)
+from src.cli._cache import cached_load_all
+from src.operations.lockfile import LockFile, LockItem
+from src.registry.loader import RegistryLoadError
+from src.operations.copier import FileCopier, CopyError
+from src.operations.merger import JSONMerger, MergeError
+from src.operations.generator import EnvExampleGenerator, GeneratorError
+from src.validation.integrity import atomic_operation, FileOperation, AtomicOperationError
+from src.validation.schema import SchemaValidationError, _default_validator
+
+
+def run(lock_file, verify, registry_path):
+    """Execute the `install` workflow (see src.cli.main.install for the CLI docs)."""
+    click.echo(f"Installing from lock file: {lock_file}")
+    click.echo(f"Registry: {registry_path}")
+
+    if verify:
+        click.echo("Hash verification: enabled\n")
+
+    try:
+        # === READ LOCK FILE ===
+
+        lock_path = Path(lock_file)
+        if not lock_path.exists():
+            click.echo(f"Error: Lock file not found: {lock_file}", err=True)
+            click.echo("\nTo create a lock file, run: claude-seed init", err=True)
+            sys.exit(EXIT_USER_ERROR)
+
+        click.echo("Reading lock file...")
+        try:
+            lock_data = FileOperation.read_json(lock_path)
+            lock = LockFile.from_dict(lock_data)
+        except Exception as e:
+            click.echo(f"Error: Invalid lock file: {e}", err=True)
+            sys.exit(EXIT_VALIDATION_ERROR)
+
+        click.echo(f"  Lock file version: {lock.version}")
+        click.echo(f"  Generated: {lock.generated}")
+        click.echo(f"  Registry: {lock.registry_path}")
+        click.echo(f"  Items: {len(lock.items)}")
+
+        # === VERIFY REGISTRY ===
+
+        click.echo("\nVerifying registry...")
+        registry_path_obj = Path(registry_path)
+
+        # Check if registry path matches lock file
+        if str(registry_path_obj.resolve()) != str(Path(lock.registry_path).resolve()):
+            click.echo(f"⚠️  Warning: Registry path mismatch")
+            click.echo(f"  Lock file expects: {lock.registry_path}")
+            click.echo(f"  Using: {registry_path}")
+            if not click.confirm("Continue anyway?", default=False):
+                sys.exit(EXIT_USER_ERROR)
+
+        # Load registry once and index items by name so each lock entry
+        # is a dict lookup instead of a scan over every metadata file
+        try:
+            all_items = cached_load_all(registry_path)
+        except RegistryLoadError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(EXIT_SYSTEM_ERROR)
+
+        items_by_name = {item.name: item for item in all_items}
+
+        # === LOAD AND VERIFY ITEMS ===
+
+        click.echo("\nLoading items from registry...")
+        items_to_install = []
+        version_mismatches = []
+
+        for item_name, lock_item in lock.items.items():
+            # Load item from registry
+            try:
+                item = items_by_name.get(item_name)
+                if not item:
+                    click.echo(f"Error: Item '{item_name}' not found in registry", err=True)
+                    sys.exit(EXIT_USER_ERROR)
+
+                # Check version match
+                if item.version != lock_item.version:
+                    version_mismatches.append({
+                        'name': item_name,
+                        'lock_version': lock_item.version,
+                        'registry_version': item.version
+                    })
+
+                items_to_install.append(item)
+
+            except Exception as e:
+                click.echo(f"Error loading '{item_name}': {e}", err=True)
+                sys.exit(EXIT_SYSTEM_ERROR)
+
+        # Handle version mismatches
+        if version_mismatches:
+            click.echo("\n⚠️  Version mismatches detected:")
+            for mismatch in version_mismatches:
+                click.echo(f"  - {mismatch['name']}: lock={mismatch['lock_version']}, registry={mismatch['registry_version']}")
+
+            click.echo("\nOptions:")
+            click.echo("  1. Update registry to match lock file versions")
+            click.echo("  2. Regenerate lock file with current registry versions (claude-seed init)")
+            click.echo("  3. Continue with registry versions (not recommended)")
+
+            if not click.confirm("\nContinue with registry versions?", default=False):
+                sys.exit(EXIT_USER_ERROR)
+
+        click.echo(f"  Loaded {len(items_to_install)} items")
+
+        # === INSTALLATION ===
+
+        click.echo("\nInstalling...")
+
+        # Check for existing .claude directory
+        output_path = Path(".claude")
+        if output_path.exists():
+            click.echo("⚠️  Warning: .claude directory already exists")
+            if not click.confirm("Overwrite?", default=False):
+                sys.exit(EXIT_USER_ERROR)
+
+        # Use atomic operation for installation
+        try:
+            with atomic_operation(".claude") as temp_dir:
+                # Copy files
+                click.echo("  Copying files...")
+                FileCopier.copy_all_items(
+                    items_to_install, Path(registry_path), temp_dir
+                )
+
+                # Merge and write .mcp.json if MCP items present
+                mcp_items = [item for item in items_to_install if item.mcp_fragment]
+                if mcp_items:
+                    click.echo("  Generating .mcp.json...")
+                    mcp_fragments = JSONMerger.build_mcp_fragments(mcp_items)
+                    merged_mcp, _ = JSONMerger.merge_mcp_fragments(
+                        mcp_fragments, detect_conflicts=False
+                    )
+
+                    # Validate merged config
+                    is_valid, errors = _default_validator().validate(merged_mcp)
+                    if not is_valid:
+                        raise SchemaValidationError(
+                            f"Invalid MCP configuration: {'; '.join(errors)}"
+                        )
+
+                    # Write with deterministic formatting
+                    mcp_path = Path(".mcp.json")
+                    FileOperation.write_json(mcp_path, merged_mcp, sort_keys=True)
+
+                # Generate .env.example if env vars present
+                env_vars_present = any(item.env_vars for item in items_to_install)
+                if env_vars_present:
+                    click.echo("  Generating .env.example...")
+                    env_path = Path(".env.example")
+                    EnvExampleGenerator.generate(items_to_install, env_path)
+
+        except AtomicOperationError as e:
+            click.echo(f"\nError during installation: {e}", err=True)
+            sys.exit(EXIT_SYSTEM_ERROR)
+        except (CopyError, MergeError, GeneratorError, SchemaValidationError) as e:
+            click.echo(f"\nError: {e}", err=True)
+            sys.exit(EXIT_SYSTEM_ERROR)
+
+        # === HASH VERIFICATION ===
+
+        if verify:
+            click.echo("\nVerifying file hashes...")
+            verification_failed = []
+
+            install_root = Path(".claude")  # Install directory for verification
+            pairs = [
+                (file_path, entry)
+                for lock_item in lock.items.values()
+                for file_path, entry in lock_item.files.items()
+            ]
+
+            def verify_entry(pair):
+                file_path, entry = pair
+                full_path = install_root / file_path
+                try:
+                    st = full_path.stat()
+                except OSError:
+                    return f"{file_path}: file not found"
+
+                expected_hash = LockItem.entry_hash(entry)
+                if isinstance(entry, dict):
+                    # Matching size and mtime means the bytes are the ones
+                    # we hashed at install time - skip the full read
+                    if (st.st_size == entry.get("size")
+                            and st.st_mtime_ns == entry.get("mtime_ns")):
+                        return None
+
+                actual_hash = FileOperation.compute_hash(full_path, lock.hash_algo)
+                if actual_hash != expected_hash:
+                    return (
+                        f"{file_path}: hash mismatch (expected {expected_hash[:16]}..., got {actual_hash[:16]}...)"
+                    )
+                return None
+
+            # Each check is independent, I/O-bound work; map preserves
+            # order so failures report in lock-file order
+            if pairs:
+                with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+                    verification_failed = [
+                        failure
+                        for failure in executor.map(verify_entry, pairs)
+                        if failure is not None
+                    ]
+
+            if verification_failed:
+                click.echo("\n❌ Hash verification failed:")
+                for error in verification_failed:
+                    click.echo(f"  - {error}")
+                click.echo("\nFiles may have been tampered with or registry has changed.")
+                sys.exit(EXIT_VALIDATION_ERROR)
+            else:
+                click.echo("  ✓ All file hashes verified")
+
+        # Success!
+        click.echo("\n✓ Installation complete!")
+        click.echo(f"\nInstalled {len(items_to_install)} items:")
+        for item in items_to_install:
+            click.echo(f"  ✓ {item.name} v{item.version}")
+
+        required_env_vars = sum(len(item.required_env_vars) for item in items_to_install)
+        if required_env_vars > 0:
+            click.echo(f"\n⚠️  Remember to create .env and set {required_env_vars} required variable(s)")
+
+        sys.exit(EXIT_SUCCESS)
+
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        if os.environ.get("CLAUDE_SEED_DEBUG"):
+            import traceback
+            traceback.print_exc()
+        sys.exit(EXIT_SYSTEM_ERROR)
@@ -0,0 +1,50 @@
+"""Click skeleton for the `list` subcommand, loaded on demand by LazyGroup."""
+
+import os
+
+import click
+
+
+@click.command("list")
+@click.option(
+    "--filter",
+    "-f",
+    multiple=True,
+    help="Filter items by tag"
+)
+@click.option(
+    "--type",
+    "-t",
+    type=click.Choice(["subagent", "command", "mcp"], case_sensitive=False),
+    help="Filter by item type"
+)
+@click.option(
+    "--json",
+    "output_json",
+    is_flag=True,
+    help="Output as JSON instead of table"
+)
+@click.option(
+    "--registry-path",
+    default=None,
+    show_default="~/.claude-registry",
+    help="Path to registry (default: ~/.claude-registry or $CLAUDE_REGISTRY_PATH)"
+)
+def list_cmd(filter, type, output_json, registry_path):
+    """List available items in the registry.
+
+    Display all sub-agents, commands, and MCP servers available for
+    installation. Can be filtered by tags or item type.
+
+    Examples:
+        claude-seed list
+        claude-seed list --filter research
+        claude-seed list --type mcp
+        claude-seed list --json
+    """
+    # Resolved here rather than in the option default so module import
+    # never pays for expanduser's home-directory lookup
+    registry_path = (registry_path or os.environ.get("CLAUDE_REGISTRY_PATH")
+                     or os.path.expanduser("~/.claude-registry"))
+    from src.cli._list_core import run
+    run(filter, type, output_json, registry_path)
@@ -0,0 +1,141 @@
+"""Core implementation of the `list` command.
+
+Imported lazily from src.cli.main so that `claude-seed --help` and
+`--version` never pay for the registry/selection import graph.
+"""
+
+import io
+import json
+import os
+import sys
+
+import click
+
+from pathlib import Path
+from src.cli.main import EXIT_SUCCESS, EXIT_SYSTEM_ERROR
+from src.cli._cache import cached_load_all
+from src.registry.loader import RegistryLoadError
+from src.selection.filter import ItemFilter
+from src.registry.models import ItemType
+
+
+def run(filter, type, output_json, registry_path):
+    """Execute the `list` workflow (see src.cli.main.list for the CLI docs)."""
+    try:
+        # Load registry
+        items = cached_load_all(registry_path)
+
+        if not items:
+            click.echo("No items found in registry", err=True)
+            sys.exit(EXIT_SUCCESS)
+
+        # Apply filters
+        if filter:
+            items = ItemFilter.by_tags(items, list(filter))
+
+        if type:
+            item_type = ItemType(type)
+            items = ItemFilter.by_type(items, item_type)
+
+        if not items:
+            click.echo("No items match the specified filters")
+            sys.exit(EXIT_SUCCESS)
+
+        # Sort by type then name
+        items = ItemFilter.sort_by_type(items)
+
+        # Output as JSON
+        if output_json:
+            items_data = []
+            for item in items:
+                items_data.append({
+                    'name': item.name,
+                    'version': item.version,
+                    'type': item.type.value,
+                    'category': item.category,
+                    'tags': item.tags,
+                    'description': item.description,
+                    'dependencies': item.dependencies,
+                    'env_vars': [
+                        {
+                            'name': env.name,
+                            'description': env.description,
+                            'required': env.required,
+                            'default': env.default
+                        }
+                        for env in item.env_vars
+                    ]
+                })
+
+            output = {
+                'registry': registry_path,
+                'count': len(items),
+                'items': items_data
+            }
+            click.echo(json.dumps(output, indent=2, sort_keys=True))
+            sys.exit(EXIT_SUCCESS)
+
+        # Output as table
+        click.echo(f"\nRegistry: {registry_path}")
+        if filter:
+            click.echo(f"Filters: {', '.join(filter)}")
+        if type:
+            click.echo(f"Type: {type}")
+
+        click.echo(f"\nFound {len(items)} item(s)\n")
+
+        # Calculate column widths
+        max_name = max(len(item.name) for item in items)
+        max_version = max(len(item.version) for item in items)
+        max_type = max(len(item.type.value) for item in items)
+
+        # Ensure minimum widths
+        max_name = max(max_name, 10)
+        max_version = max(max_version, 7)
+        max_type = max(max_type, 8)
+
+        # Table header
+        header = f"{'NAME':<{max_name}}  {'VERSION':<{max_version}}  {'TYPE':<{max_type}}  DESCRIPTION"
+        separator = "=" * len(header)
+
+        # Buffer the whole table and emit it with a single write
+        # instead of one syscall per row
+        buf = io.StringIO()
+        buf.write(separator + "\n")
+        buf.write(header + "\n")
+        buf.write(separator + "\n")
+
+        # Table rows
+        for item in items:
+            # Truncate description if too long
+            desc = item.description
+            max_desc_len = 60
+            if len(desc) > max_desc_len:
+                desc = desc[:max_desc_len-3] + "..."
+
+            row = f"{item.name:<{max_name}}  {item.version:<{max_version}}  {item.type.value:<{max_type}}  {desc}"
+            buf.write(row + "\n")
+
+        buf.write(separator + "\n")
+        click.echo(buf.getvalue(), nl=False)
+
+        # Summary by type
+        type_counts = {}
+        for item in items:
+            type_counts[item.type.value] = type_counts.get(item.type.value, 0) + 1
+
+        click.echo("\nSummary:")
+        for item_type, count in sorted(type_counts.items()):
+            click.echo(f"  {item_type}: {count}")
+
+        sys.exit(EXIT_SUCCESS)
+
+    except RegistryLoadError as e:
+        click.echo(f"Error loading registry: {e}", err=True)
+        sys.exit(EXIT_SYSTEM_ERROR)
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        if os.environ.get("CLAUDE_SEED_DEBUG"):
+            import traceback
+            traceback.print_exc()
+        sys.exit(EXIT_SYSTEM_ERROR)
@@ -1,25 +1,139 @@
 """File copier with directory structure preservation."""
 
+import asyncio
+import errno
+import functools
+import hashlib
+import os
 import shutil
+import stat
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 from src.registry.models import RegistryItem
 
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None  # Fall back to SHA-256
+
+
+# Chunk size for streaming copies that tee bytes through a hasher
+COPY_CHUNK_SIZE = 1024 * 1024
+
+def _default_copy_workers() -> int:
+    """Concurrent item copies: scale with cores, bound file descriptors.
+
+    Small-file copies are dominated by per-file syscall latency rather
+    than CPU, so oversubscribe the cores; cap at 32 so a large registry
+    cannot exhaust descriptors.
+    """
+    return min(32, (os.cpu_count() or 1) * 4)
+
 
 class CopyError(Exception):
     """Exception raised when file copy operation fails."""
     pass
 
 
+def _new_hasher(algo: str):
+    """Create a streaming hasher for the given lock-file algorithm.
+
+    Raises:
+        CopyError: If the algorithm is unknown or unavailable
+    """
+    if algo == "sha256":
+        return hashlib.sha256()
+    if algo == "blake3" and blake3 is not None:
+        return blake3()
+    raise CopyError(f"Unsupported hash algorithm: {algo}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_safe_path_cached(path: str) -> bool:
+    """Validate a relative path once per unique string.
+
+    Items frequently share file mappings, so the same paths are checked
+    over and over during a large copy. validate_safe_path raises on bad
+    input and lru_cache does not memoize exceptions, so only successful
+    validations are remembered.
+    """
+    from src.validation.integrity import validate_safe_path
+
+    validate_safe_path(path, allow_absolute=False)
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _item_dir_cached(registry_path: str, namespace: str, name: str) -> Path:
+    """Build (once per item) the registry directory holding its files.
+
+    A single CLI run resolves the same directory across the preview,
+    size and copy phases; caching on plain strings keeps the key
+    hashable and skips the repeated Path construction.
+    """
+    return Path(registry_path) / namespace / name
+
+
+def _fast_copy(source: Path, dest: Path):
+    """Copy file data without routing the bytes through user space.
+
+    Uses os.copy_file_range where available, which stays entirely in the
+    kernel and can reflink on supporting filesystems. Falls back to
+    shutil.copyfile - itself sendfile-backed on Linux - when the syscall
+    is missing or refuses this pair of files (e.g. cross-device).
+    """
+    size = os.stat(source).st_size
+    if size == 0:
+        # Nothing to transfer; just create/truncate the destination
+        with open(dest, 'wb'):
+            return
+
+    if hasattr(os, "copy_file_range"):
+        with open(source, 'rb') as src, open(dest, 'wb') as dst:
+            try:
+                remaining = size
+                while remaining > 0:
+                    sent = os.copy_file_range(
+                        src.fileno(), dst.fileno(), remaining
+                    )
+                    if sent == 0:
+                        break  # Source shrank underneath us
+                    remaining -= sent
+                if remaining == 0:
+                    return
+            except OSError as e:
+                if e.errno not in (
+                    errno.EXDEV, errno.EINVAL,
+                    errno.ENOSYS, errno.EOPNOTSUPP,
+                ):
+                    raise
+        # copyfile truncates, so a partial transfer above is harmless
+
+    shutil.copyfile(source, dest)
+
+
 class FileCopier:
     """Copier for registry item files."""
 
+    @staticmethod
+    def _item_dir(registry_path: Path, item: RegistryItem) -> Path:
+        """Registry directory that holds this item's files.
+
+        Structure: registry/{namespace}/{item-name}/, using the same
+        type-to-namespace mapping the loader reads from.
+        """
+        return _item_dir_cached(
+            str(registry_path), item.type.namespace, item.name
+        )
+
     @staticmethod
     def copy_item_files(
         item: RegistryItem,
         registry_path: Path,
         dest_root: Path,
-        dry_run: bool = False
+        dry_run: bool = False,
+        hashes: Optional[Dict[str, str]] = None,
+        hash_algo: str = "sha256"
     ) -> List[str]:
         """Copy files for a single registry item.
 
@@ -28,6 +142,9 @@ class FileCopier:
             registry_path: Root path to registry
             dest_root: Root destination directory
             dry_run: If True, don't actually copy files
+            hashes: Optional dict to fill with destination path -> file
+                hash, computed while the bytes stream through the copy
+            hash_algo: Hash algorithm when hashes is given
 
         Returns:
             List of destination file paths that were (or would be) created
@@ -35,27 +152,34 @@ class FileCopier:
         Raises:
             CopyError: If copy operation fails
         """
-        from src.validation.integrity import validate_safe_path, PathTraversalError
+        from src.validation.integrity import PathTraversalError
 
         copied_files = []
 
         # Determine item directory in registry
-        # Structure: registry/{namespace}/{item-name}/
-        item_dir = registry_path / item.type.value + "s" / item.name
+        item_dir = FileCopier._item_dir(registry_path, item)
 
         if not dry_run and not item_dir.exists():
             raise CopyError(
                 f"Item directory not found: {item_dir}"
             )
 
-        # Copy each file according to file mappings
+        # Validate all paths for security before touching the filesystem
         for dest_path, source_path in item.files.items():
-            # Validate paths for security
             try:
-                validate_safe_path(dest_path, allow_absolute=False)
-                validate_safe_path(source_path, allow_absolute=False)
+                _validate_safe_path_cached(dest_path)
+                _validate_safe_path_cached(source_path)
             except PathTraversalError as e:
                 raise CopyError(f"Security: {e}") from e
+
+        if not dry_run:
+            # Create each unique destination directory once instead of
+            # issuing a mkdir per file into the same subdirectory
+            for parent in {(dest_root / p).parent for p in item.files}:
+                parent.mkdir(parents=True, exist_ok=True)
+
+        # Copy each file according to file mappings
+        for dest_path, source_path in item.files.items():
             full_source = item_dir / source_path
             full_dest = dest_root / dest_path
 
@@ -65,12 +189,31 @@ class FileCopier:
                         f"Source file not found: {full_source}"
                     )
 
-                # Create parent directories
-                full_dest.parent.mkdir(parents=True, exist_ok=True)
-
-                # Copy file preserving metadata
+                # Copy file preserving metadata. When a hash dict is
+                # supplied, tee the bytes through the hasher during the
+                # copy so the file is never read twice.
+                hasher = _new_hasher(hash_algo) if hashes is not None else None
                 try:
-                    shutil.copy2(full_source, full_dest)
+                    if hasher is None:
+                        _fast_copy(full_source, full_dest)
+                        shutil.copystat(full_source, full_dest)
+                    else:
+                        # Hashing needs the bytes in user space; reuse
+                        # one buffer instead of allocating per chunk
+                        buf = bytearray(COPY_CHUNK_SIZE)
+                        view = memoryview(buf)
+                        # buffering=0: our reads/writes are already a
+                        # full chunk, so skip the io-layer copy
+                        with open(full_source, 'rb', buffering=0) as src, \
+                                open(full_dest, 'wb', buffering=0) as dst:
+                            while True:
+                                n = src.readinto(buf)
+                                if not n:
+                                    break
+                                hasher.update(view[:n])
+                                dst.write(view[:n])
+                        shutil.copystat(full_source, full_dest)
+                        hashes[str(dest_path)] = f"{hash_algo}:{hasher.hexdigest()}"
                 except Exception as e:
                     raise CopyError(
                         f"Failed to copy {source_path} to {dest_path}: {e}"
@@ -85,8 +228,11 @@ class FileCopier:
         items: List[RegistryItem],
         registry_path: Path,
         dest_root: Path,
-        dry_run: bool = False
-    ) -> Dict[str, List[str]]:
+        dry_run: bool = False,
+        collect_hashes: bool = False,
+        hash_algo: str = "sha256",
+        max_workers: Optional[int] = None
+    ) -> Dict:
         """Copy files for multiple registry items.
 
         Args:
@@ -94,27 +240,67 @@ class FileCopier:
             registry_path: Root path to registry
             dest_root: Root destination directory
             dry_run: If True, don't actually copy files
+            collect_hashes: If True, hash each file during the copy
+            hash_algo: Hash algorithm when collect_hashes is True
+            max_workers: Concurrent item copies (defaults to a
+                core-scaled count capped at 32)
 
         Returns:
-            Dictionary mapping item names to list of copied file paths
+            Dictionary mapping item names to list of copied file paths,
+            or - when collect_hashes is True - destination paths to
+            '<algo>:<hex>' hashes
 
         Raises:
             CopyError: If any copy operation fails
         """
         results = {}
+        hashes = {} if collect_hashes else None
 
-        for item in items:
-            try:
-                copied = FileCopier.copy_item_files(
-                    item, registry_path, dest_root, dry_run
+        if dry_run:
+            # No I/O to overlap - keep the serial path
+            outcomes = []
+            for item in items:
+                try:
+                    outcomes.append(FileCopier.copy_item_files(
+                        item, registry_path, dest_root, dry_run,
+                        hashes=hashes, hash_algo=hash_algo
+                    ))
+                except CopyError as e:
+                    outcomes.append(e)
+        else:
+            # Items are independent, so their reads and writes can
+            # overlap; each copy runs in a worker thread and a semaphore
+            # caps how many are in flight at once
+            async def _copy_all():
+                semaphore = asyncio.Semaphore(
+                    max_workers or _default_copy_workers()
+                )
+
+                async def copy_one(item):
+                    async with semaphore:
+                        return await asyncio.to_thread(
+                            FileCopier.copy_item_files,
+                            item, registry_path, dest_root, dry_run,
+                            hashes, hash_algo
+                        )
+
+                return await asyncio.gather(
+                    *(copy_one(item) for item in items),
+                    return_exceptions=True
                 )
-                results[item.name] = copied
-            except CopyError as e:
+
+            outcomes = asyncio.run(_copy_all())
+
+        for item, outcome in zip(items, outcomes):
+            if isinstance(outcome, CopyError):
                 raise CopyError(
-                    f"Failed to copy files for '{item.name}': {e}"
-                ) from e
+                    f"Failed to copy files for '{item.name}': {outcome}"
+                ) from outcome
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results[item.name] = outcome
 
-        return results
+        return hashes if collect_hashes else results
 
     @staticmethod
     def get_total_size(
@@ -133,12 +319,18 @@ class FileCopier:
         total_size = 0
 
         for item in items:
-            item_dir = registry_path / item.type.value + "s" / item.name
+            # Plain-string joins: no Path allocation per file
+            item_dir = os.fspath(FileCopier._item_dir(registry_path, item))
 
             for dest_path, source_path in item.files.items():
-                full_source = item_dir / source_path
-                if full_source.exists() and full_source.is_file():
-                    total_size += full_source.stat().st_size
+                full_source = os.path.join(item_dir, source_path)
+                # One stat answers existence, type and size together
+                try:
+                    st = os.stat(full_source)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    total_size += st.st_size
 
         return total_size
 
@@ -177,15 +369,20 @@ class FileCopier:
         operations = []
 
         for item in items:
-            item_dir = registry_path / item.type.value + "s" / item.name
+            # Plain-string joins: no Path allocation per file
+            item_dir = os.fspath(FileCopier._item_dir(registry_path, item))
 
             for dest_path, source_path in item.files.items():
-                full_source = item_dir / source_path
-                full_dest = dest_root / dest_path
+                full_source = os.path.join(item_dir, source_path)
 
                 size = 0
-                if full_source.exists() and full_source.is_file():
-                    size = full_source.stat().st_size
+                # One stat answers existence, type and size together
+                try:
+                    st = os.stat(full_source)
+                    if stat.S_ISREG(st.st_mode):
+                        size = st.st_size
+                except OSError:
+                    pass
 
                 operations.append({
                     'item': item.name,
@@ -212,11 +409,11 @@ class FileCopier:
             List of existing file paths
         """
         existing = []
+        dest_root_s = os.fspath(dest_root)
 
         for item in items:
             for dest_path in item.files.keys():
-                full_dest = dest_root / dest_path
-                if full_dest.exists():
+                if os.path.exists(os.path.join(dest_root_s, dest_path)):
                     existing.append(str(dest_path))
 
         return existing
@@ -246,16 +443,22 @@ class FileCopier:
 
     @staticmethod
     def _remove_empty_dirs(path: Path):
-        """Recursively remove empty directories.
+        """Remove empty directories under path, deepest first.
+
+        Walks bottom-up so nested empty trees collapse; rmdir itself is
+        the emptiness check, refusing non-empty directories.
 
         Args:
             path: Directory path to clean
         """
+        root_s = os.fspath(path)
         try:
-            for item in path.iterdir():
-                if item.is_dir():
-                    FileCopier._remove_empty_dirs(item)
-                    if not any(item.iterdir()):
-                        item.rmdir()
+            for root, dirs, files in os.walk(path, topdown=False):
+                if root == root_s:
+                    continue  # Never remove the tree root itself
+                try:
+                    os.rmdir(root)
+                except OSError:
+                    pass  # Not empty (or already gone)
         except Exception:
             pass  # Ignore errors during cleanup
@@ -1,12 +1,33 @@
 """Generators for .env.example and README sections."""
 
+import operator
+
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, List, Set
 from datetime import datetime
 
 from src.registry.models import RegistryItem, EnvVar
 
 
+# attrgetter comparisons run without a Python frame per element
+_BY_NAME = operator.attrgetter("name")
+
+
+def _collect_unique_env_vars(items: List[RegistryItem]) -> Dict[str, EnvVar]:
+    """Deduplicate env vars across items, first occurrence winning.
+
+    Iterating items and their vars reversed turns the dict's
+    last-write-wins into first-write-wins, so the whole dedup runs as
+    one C-level comprehension instead of a membership test per var.
+    """
+    return {
+        env.name: env
+        for item in reversed(items)
+        for env in reversed(item.env_vars)
+    }
+
+
 class GeneratorError(Exception):
     """Exception raised when generation fails."""
     pass
@@ -30,49 +51,43 @@ class EnvExampleGenerator:
             Generated .env.example content as string
         """
         # Collect all unique environment variables
-        env_vars_dict = {}
-        for item in items:
-            for env in item.env_vars:
-                if env.name not in env_vars_dict:
-                    env_vars_dict[env.name] = env
+        env_vars_dict = _collect_unique_env_vars(items)
 
         if not env_vars_dict:
             content = "# No environment variables required\n"
         else:
-            # Sort by required status (required first) then by name
-            sorted_vars = sorted(
-                env_vars_dict.values(),
-                key=lambda e: (not e.required, e.name)
-            )
-
-            lines = [
-                "# Environment variables for Claude Code setup",
-                f"# Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}",
-                "",
-                "# Copy this file to .env and fill in your values",
-                "# DO NOT commit .env to version control",
-                ""
+            # Sort by name once; the required/optional split below
+            # supplies the required-first ordering
+            sorted_vars = sorted(env_vars_dict.values(), key=_BY_NAME)
+
+            # Accumulate pre-joined blocks and concatenate once at the
+            # end - no per-variable list churn or join re-scanning
+            parts = [
+                "# Environment variables for Claude Code setup\n"
+                f"# Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+                "\n"
+                "# Copy this file to .env and fill in your values\n"
+                "# DO NOT commit .env to version control\n"
+                "\n"
             ]
 
             # Add required variables
             required_vars = [v for v in sorted_vars if v.required]
             if required_vars:
-                lines.append("# === REQUIRED ===")
-                lines.append("")
+                parts.append("# === REQUIRED ===\n\n")
                 for env in required_vars:
-                    lines.extend(EnvExampleGenerator._format_env_var(env))
+                    parts.append(EnvExampleGenerator._format_env_var(env))
 
             # Add optional variables
             optional_vars = [v for v in sorted_vars if not v.required]
             if optional_vars:
                 if required_vars:
-                    lines.append("")
-                lines.append("# === OPTIONAL ===")
-                lines.append("")
+                    parts.append("\n")
+                parts.append("# === OPTIONAL ===\n\n")
                 for env in optional_vars:
-                    lines.extend(EnvExampleGenerator._format_env_var(env))
+                    parts.append(EnvExampleGenerator._format_env_var(env))
 
-            content = "\n".join(lines) + "\n"
+            content = "".join(parts)
 
         # Write to file if path provided
         if output_path:
@@ -87,33 +102,21 @@ class EnvExampleGenerator:
         return content
 
     @staticmethod
-    def _format_env_var(env: EnvVar) -> List[str]:
+    def _format_env_var(env: EnvVar) -> str:
         """Format environment variable for .env.example.
 
         Args:
             env: EnvVar instance
 
         Returns:
-            List of lines (including comments and value)
+            Pre-joined block (description comment, optional default
+            hint, assignment, trailing blank line)
         """
-        lines = []
-
-        # Add description as comment
-        lines.append(f"# {env.description}")
-
-        # Add default value hint if present
-        if env.default:
-            lines.append(f"# Default: {env.default}")
-
-        # Add variable with placeholder or default
-        if env.default:
-            lines.append(f"{env.name}={env.default}")
-        else:
-            lines.append(f"{env.name}=")
-
-        lines.append("")  # Blank line between variables
-
-        return lines
+        return (
+            f"# {env.description}\n"
+            + (f"# Default: {env.default}\n" if env.default else "")
+            + f"{env.name}={env.default or ''}\n\n"
+        )
 
 
 class READMEGenerator:
@@ -140,16 +143,19 @@ class READMEGenerator:
             ""
         ]
 
-        # Group items by type
-        subagents = [i for i in items if i.type.value == "subagent"]
-        commands = [i for i in items if i.type.value == "command"]
-        mcp_servers = [i for i in items if i.type.value == "mcp"]
+        # Group items by type in one pass
+        groups = defaultdict(list)
+        for item in items:
+            groups[item.type.value].append(item)
+        subagents = groups["subagent"]
+        commands = groups["command"]
+        mcp_servers = groups["mcp"]
 
         # List sub-agents
         if subagents:
             lines.append("## Sub-Agents")
             lines.append("")
-            for item in sorted(subagents, key=lambda x: x.name):
+            for item in sorted(subagents, key=_BY_NAME):
                 lines.append(f"- **{item.name}** (v{item.version}): {item.description}")
             lines.append("")
 
@@ -157,7 +163,7 @@ class READMEGenerator:
         if commands:
             lines.append("## Commands")
             lines.append("")
-            for item in sorted(commands, key=lambda x: x.name):
+            for item in sorted(commands, key=_BY_NAME):
                 lines.append(f"- **/{item.name}** (v{item.version}): {item.description}")
             lines.append("")
 
@@ -165,7 +171,7 @@ class READMEGenerator:
         if mcp_servers:
             lines.append("## MCP Servers")
             lines.append("")
-            for item in sorted(mcp_servers, key=lambda x: x.name):
+            for item in sorted(mcp_servers, key=_BY_NAME):
                 lines.append(f"- **{item.name}** (v{item.version}): {item.description}")
             lines.append("")
 
@@ -183,14 +189,14 @@ class READMEGenerator:
             if required:
                 lines.append("### Required")
                 lines.append("")
-                for env in sorted(required, key=lambda x: x.name):
+                for env in sorted(required, key=_BY_NAME):
                     lines.append(f"- `{env.name}`: {env.description}")
                 lines.append("")
 
             if optional:
                 lines.append("### Optional")
                 lines.append("")
-                for env in sorted(optional, key=lambda x: x.name):
+                for env in sorted(optional, key=_BY_NAME):
                     lines.append(f"- `{env.name}`: {env.description}")
                     if env.default:
                         lines.append(f"  - Default: `{env.default}`")
@@ -231,12 +237,7 @@ class READMEGenerator:
         Returns:
             List of unique EnvVar instances
         """
-        env_vars_dict = {}
-        for item in items:
-            for env in item.env_vars:
-                if env.name not in env_vars_dict:
-                    env_vars_dict[env.name] = env
-        return list(env_vars_dict.values())
+        return list(_collect_unique_env_vars(items).values())
 
     @staticmethod
     def generate_compatibility_notes(
@@ -263,7 +264,7 @@ class READMEGenerator:
             ""
         ]
 
-        for item in sorted(items_with_notes, key=lambda x: x.name):
+        for item in sorted(items_with_notes, key=_BY_NAME):
             lines.append(f"### {item.name} (v{item.version})")
             lines.append("")
             lines.append(item.compatibility_notes)
@@ -288,30 +289,35 @@ class READMEGenerator:
             ""
         ]
 
+        # Group items by type in one pass
+        groups = defaultdict(list)
+        for item in items:
+            groups[item.type.value].append(item)
+
         # Commands reference
-        commands = [i for i in items if i.type.value == "command"]
+        commands = groups["command"]
         if commands:
             lines.append("### Available Commands")
             lines.append("")
-            for cmd in sorted(commands, key=lambda x: x.name):
+            for cmd in sorted(commands, key=_BY_NAME):
                 lines.append(f"- `/{cmd.name}` - {cmd.description}")
             lines.append("")
 
         # Sub-agents reference
-        subagents = [i for i in items if i.type.value == "subagent"]
+        subagents = groups["subagent"]
         if subagents:
             lines.append("### Sub-Agents")
             lines.append("")
-            for agent in sorted(subagents, key=lambda x: x.name):
+            for agent in sorted(subagents, key=_BY_NAME):
                 lines.append(f"- `@{agent.name}` - {agent.description}")
             lines.append("")
 
         # MCP servers reference
-        mcp_servers = [i for i in items if i.type.value == "mcp"]
+        mcp_servers = groups["mcp"]
         if mcp_servers:
             lines.append("### MCP Servers")
             lines.append("")
-            for server in sorted(mcp_servers, key=lambda x: x.name):
+            for server in sorted(mcp_servers, key=_BY_NAME):
                 lines.append(f"- `{server.name}` - {server.description}")
             lines.append("")
 
@@ -1,11 +1,38 @@
 """Data models and operations for lock files."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 from datetime import datetime
 from enum import Enum
 import re
 import hashlib
+import json
+import mmap
+import os
+
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None  # Fall back to SHA-256
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
+
+# Below this size the mmap/madvise syscalls cost more than they save
+_MMAP_THRESHOLD = 64 * 1024
+
+# Fewer files than this and thread-pool startup outweighs the overlap
+_PARALLEL_VERIFY_THRESHOLD = 8
+
+# Compiled once: __post_init__ runs these for every item and file entry
+# each time a lock file is deserialized
+_ITEM_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+')
+_HASH_RE = re.compile(r'^(?:sha256|blake3):[0-9a-f]{64}$')
+_LOCK_VERSION_RE = re.compile(r'^\d+\.\d+')
 
 
 class LockItemType(Enum):
@@ -22,52 +49,105 @@ class LockItem:
     Attributes:
         type: Item type (subagent, command, or mcp)
         version: Semver version installed
-        files: Map of destination path to SHA-256 hash
+        files: Map of destination path to either an '<algo>:<hex>' hash
+            (legacy form) or a {"hash", "size", "mtime_ns"} entry; the
+            metadata lets verification skip re-hashing unchanged files
     """
     type: LockItemType
     version: str
-    files: Dict[str, str]
+    files: Dict[str, object]
 
     def __post_init__(self):
         """Validate lock item constraints."""
         # Validate version is semver-like
-        if not re.match(r'^\d+\.\d+\.\d+', self.version):
+        if not _ITEM_VERSION_RE.match(self.version):
             raise ValueError(
                 f"Invalid version '{self.version}'. "
                 "Must be valid semver (e.g., '2.1.0')"
             )
 
         # Validate hash format
-        for path, hash_value in self.files.items():
-            if not re.match(r'^sha256:[0-9a-f]{64}$', hash_value):
+        for path, entry in self.files.items():
+            hash_value = LockItem.entry_hash(entry)
+            if not _HASH_RE.match(hash_value):
                 raise ValueError(
                     f"Invalid hash format for '{path}': {hash_value}. "
-                    "Must be 'sha256:' prefix + 64 hex chars"
+                    "Must be 'sha256:' or 'blake3:' prefix + 64 hex chars"
                 )
 
         # Convert string type to enum if needed
         if isinstance(self.type, str):
             self.type = LockItemType(self.type)
 
+    @staticmethod
+    def entry_hash(entry) -> str:
+        """Return the hash string from a files entry.
+
+        Accepts both the legacy bare-hash form and the metadata dict form.
+        """
+        return entry["hash"] if isinstance(entry, dict) else entry
+
     def verify_file_hash(self, file_path: str, expected_hash: str) -> bool:
-        """Compute the file's SHA-256 and compare to expected 'sha256:<hex>'.
+        """Hash the file and compare to expected '<algo>:<hex>'.
+
+        The algorithm is taken from the expected hash's prefix, so
+        blake3 locks written by create_new verify with blake3 and older
+        sha256 locks keep verifying with SHA-256.
 
         Args:
             file_path: Path to the file to verify
-            expected_hash: Expected hash in format 'sha256:<hex>'
+            expected_hash: Expected hash in format 'sha256:<hex>' or
+                'blake3:<hex>'
 
         Returns:
             bool: True if file exists and hash matches, False otherwise
+            (including when a blake3 hash cannot be checked because the
+            library is not installed)
         """
+        algo = expected_hash.partition(":")[0].lower()
+        if algo == "blake3":
+            if blake3 is None:
+                return False  # Cannot recompute blake3 without the library
+            new_hasher = blake3
+        else:
+            algo = "sha256"
+            new_hasher = hashlib.sha256
+
         try:
-            h = hashlib.sha256()
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(1024 * 1024), b""):
-                    h.update(chunk)
-            actual = f"sha256:{h.hexdigest()}"
+                size = os.fstat(f.fileno()).st_size
+                if size >= _MMAP_THRESHOLD:
+                    # Map the file and hash the mapping directly: the
+                    # kernel pages bytes in on demand and nothing is
+                    # copied into an intermediate buffer
+                    with mmap.mmap(
+                        f.fileno(), size, access=mmap.ACCESS_READ
+                    ) as mm:
+                        if hasattr(mm, "madvise"):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        h = new_hasher(mm)
+                        if hasattr(mm, "madvise"):
+                            # Drop the pages so verifying a large
+                            # registry does not balloon the page cache
+                            mm.madvise(mmap.MADV_DONTNEED)
+                elif hasattr(hashlib, "file_digest"):
+                    # Python 3.11+: the read/update loop runs in C
+                    h = hashlib.file_digest(f, new_hasher)
+                else:
+                    # Pre-3.11 fallback: read into one reusable buffer
+                    # instead of allocating a bytes object per chunk
+                    h = new_hasher()
+                    buf = bytearray(1024 * 1024)
+                    view = memoryview(buf)
+                    while True:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        h.update(view[:n])
+            actual = f"{algo}:{h.hexdigest()}"
             # Normalize expected to lowercase for robustness
             return actual == expected_hash.lower()
-        except (FileNotFoundError, IOError):
+        except (FileNotFoundError, IOError, ValueError):
             return False
 
     def verify_all_files(self, base_path: str = "") -> Dict[str, bool]:
@@ -81,9 +161,11 @@ class LockItem:
         """
         from pathlib import Path
         results = {}
-        for file_path, expected_hash in self.files.items():
+        for file_path, entry in self.files.items():
             full_path = Path(base_path) / file_path if base_path else Path(file_path)
-            results[file_path] = self.verify_file_hash(str(full_path), expected_hash)
+            results[file_path] = self.verify_file_hash(
+                str(full_path), LockItem.entry_hash(entry)
+            )
         return results
 
 
@@ -96,16 +178,18 @@ class LockFile:
         generated: ISO 8601 timestamp
         registry_path: Absolute path to registry used
         items: Map of item name to lock entry
+        hash_algo: Hash algorithm used for file hashes
     """
     version: str
     generated: str
     registry_path: str
     items: Dict[str, LockItem] = field(default_factory=dict)
+    hash_algo: str = "sha256"
 
     def __post_init__(self):
         """Validate lock file constraints."""
         # Validate version is semver-like
-        if not re.match(r'^\d+\.\d+', self.version):
+        if not _LOCK_VERSION_RE.match(self.version):
             raise ValueError(
                 f"Invalid lock file version '{self.version}'. "
                 "Must match semantic version (e.g., '1.0')"
@@ -122,12 +206,17 @@ class LockFile:
 
     @staticmethod
     def create_new(registry_path: str) -> 'LockFile':
-        """Create a new lock file with current timestamp."""
+        """Create a new lock file with current timestamp.
+
+        New locks record BLAKE3 hashes when the library is installed;
+        old locks keep verifying through the sha256 default.
+        """
         return LockFile(
             version="1.0",
             generated=datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
             registry_path=registry_path,
-            items={}
+            items={},
+            hash_algo="blake3" if blake3 is not None else "sha256"
         )
 
     def add_item(self, name: str, lock_item: LockItem):
@@ -156,18 +245,49 @@ class LockFile:
             return True
         return False
 
-    def verify_all_items(self, base_path: str = "") -> Dict[str, Dict[str, bool]]:
+    def verify_all_items(
+        self,
+        base_path: str = "",
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Dict[str, bool]]:
         """Verify hashes for all files in all lock items.
 
+        Each file is an independent hash stream (and hashlib releases
+        the GIL for large buffers), so verification fans out across a
+        thread pool; small sets stay serial since pool startup would
+        outweigh the overlap.
+
         Args:
             base_path: Base directory path to prepend to file paths
+            max_workers: Thread count for parallel verification
+                (defaults to a core-scaled count capped at 32)
 
         Returns:
             Nested dict: {item_name: {file_path: verification_result}}
         """
-        results = {}
-        for item_name, lock_item in self.items.items():
-            results[item_name] = lock_item.verify_all_files(base_path)
+        from pathlib import Path
+
+        tasks = [
+            (item_name, file_path, lock_item, LockItem.entry_hash(entry))
+            for item_name, lock_item in self.items.items()
+            for file_path, entry in lock_item.files.items()
+        ]
+
+        def verify_one(task):
+            _, file_path, lock_item, expected = task
+            full_path = Path(base_path) / file_path if base_path else Path(file_path)
+            return lock_item.verify_file_hash(str(full_path), expected)
+
+        if len(tasks) < _PARALLEL_VERIFY_THRESHOLD:
+            outcomes = [verify_one(task) for task in tasks]
+        else:
+            workers = max_workers or min(32, (os.cpu_count() or 4))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(verify_one, tasks))
+
+        results = {item_name: {} for item_name in self.items}
+        for (item_name, file_path, _, _), verified in zip(tasks, outcomes):
+            results[item_name][file_path] = verified
         return results
 
     def to_dict(self) -> Dict:
@@ -176,6 +296,7 @@ class LockFile:
             "version": self.version,
             "generated": self.generated,
             "registry_path": self.registry_path,
+            "hash_algo": self.hash_algo,
             "items": {
                 name: {
                     "type": item.type.value,
@@ -186,6 +307,25 @@ class LockFile:
             }
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to indented, key-sorted JSON bytes.
+
+        Goes through orjson's C encoder when the library is installed;
+        output matches json.dumps(indent=2, sort_keys=True).
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            )
+        return json.dumps(data, indent=2, sort_keys=True).encode()
+
+    @staticmethod
+    def from_json_bytes(data: bytes) -> 'LockFile':
+        """Deserialize a lock file from JSON bytes."""
+        parsed = orjson.loads(data) if orjson is not None else json.loads(data)
+        return LockFile.from_dict(parsed)
+
     @staticmethod
     def from_dict(data: Dict) -> 'LockFile':
         """Create lock file from dictionary (JSON deserialization)."""
@@ -202,5 +342,6 @@ class LockFile:
             version=data["version"],
             generated=data["generated"],
             registry_path=data["registry_path"],
-            items=items
+            items=items,
+            hash_algo=data.get("hash_algo", "sha256")
         )
@@ -1,7 +1,10 @@
 """JSON merger with recursive deep merge and conflict detection."""
 
+import json
+import sys
+
 from typing import Dict, List, Any, Tuple
-from copy import deepcopy
+from src.registry.models import RegistryItem
 from src.selection.models import Conflict
 
 
@@ -10,19 +13,27 @@ class MergeError(Exception):
     pass
 
 
+class _ConflictFound(Exception):
+    """Internal sentinel aborting a conflict scan on the first hit."""
+    pass
+
+
 class JSONMerger:
     """Merger for JSON configurations with conflict detection."""
 
     @staticmethod
     def merge(
         fragments: List[Dict[str, Any]],
-        detect_conflicts: bool = True
+        detect_conflicts: bool = True,
+        copy_inputs: bool = False
     ) -> Tuple[Dict[str, Any], List[Conflict]]:
         """Merge multiple JSON fragments with conflict detection.
 
         Args:
             fragments: List of JSON dictionaries to merge
             detect_conflicts: If True, detect and return conflicts
+            copy_inputs: If True, clone fragments first so the merged
+                result can be mutated without touching the inputs
 
         Returns:
             Tuple of (merged_dict, conflicts_list)
@@ -31,10 +42,15 @@ class JSONMerger:
             When conflicts occur:
             - Last value wins (overwrites previous)
             - Conflict is recorded for reporting
+            The merged result shares untouched subtrees with the input
+            fragments unless copy_inputs is set.
         """
         if not fragments:
             return ({}, [])
 
+        if copy_inputs:
+            fragments = [json.loads(json.dumps(f)) for f in fragments]
+
         conflicts = []
         result = {}
 
@@ -64,16 +80,23 @@ class JSONMerger:
     @staticmethod
     def merge_with_item_names(
         item_fragments: Dict[str, Dict[str, Any]],
-        detect_conflicts: bool = True
+        detect_conflicts: bool = True,
+        require_key: str = None
     ) -> Tuple[Dict[str, Any], List[Conflict]]:
         """Merge fragments with item names for better conflict reporting.
 
         Args:
             item_fragments: Dictionary mapping item names to their fragments
             detect_conflicts: If True, detect and return conflicts
+            require_key: If set, raise MergeError for any fragment
+                missing this top-level key (checked in the merge loop,
+                so validation costs no extra pass)
 
         Returns:
             Tuple of (merged_dict, conflicts_list)
+
+        Raises:
+            MergeError: If require_key is set and a fragment lacks it
         """
         if not item_fragments:
             return ({}, [])
@@ -83,6 +106,10 @@ class JSONMerger:
         value_sources = {}
 
         for item_name, fragment in item_fragments.items():
+            if require_key is not None and require_key not in fragment:
+                raise MergeError(
+                    f"MCP fragment from '{item_name}' missing '{require_key}' key"
+                )
             if detect_conflicts:
                 JSONMerger._merge_with_tracking(
                     result,
@@ -101,21 +128,33 @@ class JSONMerger:
     def _deep_merge(target: Dict, source: Dict):
         """Deep merge source into target (no conflict tracking).
 
+        Values are assigned by reference - fragments are read-only once
+        loaded, so per-node deepcopy was pure overhead. Dicts that merge
+        recursively are shallow-copied one level at a time, so a shared
+        input subtree is never mutated; subtrees no fragment overlaps
+        stay shared.
+
         Args:
             target: Target dictionary (modified in place)
             source: Source dictionary
         """
+        # No overlapping keys (always true for the first fragment into
+        # an empty result): the merge is one C-level dict update
+        if target.keys().isdisjoint(source):
+            target.update(source)
+            return
+
         for key, value in source.items():
-            if key in target:
-                if isinstance(target[key], dict) and isinstance(value, dict):
-                    # Recursively merge nested dictionaries
-                    JSONMerger._deep_merge(target[key], value)
-                else:
-                    # Overwrite with source value
-                    target[key] = deepcopy(value)
+            if (key in target
+                    and isinstance(target[key], dict)
+                    and isinstance(value, dict)):
+                # Copy this level before recursing into it
+                node = dict(target[key])
+                target[key] = node
+                JSONMerger._deep_merge(node, value)
             else:
-                # Add new key
-                target[key] = deepcopy(value)
+                # Add or overwrite with the source value
+                target[key] = value
 
     @staticmethod
     def _merge_with_tracking(
@@ -126,7 +165,12 @@ class JSONMerger:
         conflicts: List[Conflict],
         path: List[str]
     ):
-        """Deep merge with conflict tracking.
+        """Deep merge with conflict tracking (iterative).
+
+        Paths travel as tuples on an explicit work stack instead of a
+        fresh list per recursion level, and value sources are keyed by
+        those same tuples, so no dotted string is ever joined here -
+        Conflict builds its own path_str for display.
 
         Args:
             target: Target dictionary (modified in place)
@@ -134,61 +178,75 @@ class JSONMerger:
             value_sources: Dictionary tracking value sources
             item_name: Name of item providing source values
             conflicts: List to append conflicts to
-            path: Current path in nested structure
+            path: Starting path in nested structure
         """
-        for key, value in source.items():
-            current_path = path + [key]
-            path_key = ".".join(current_path)
-
-            if key in target:
-                # Key already exists - check for conflict
-                if isinstance(target[key], dict) and isinstance(value, dict):
-                    # Both are dicts - recursively merge
-                    JSONMerger._merge_with_tracking(
-                        target[key],
-                        value,
-                        value_sources,
-                        item_name,
-                        conflicts,
-                        current_path
-                    )
-                elif isinstance(target[key], list) and isinstance(value, list):
-                    # Both are lists - concatenate and deduplicate
-                    combined = target[key] + value
-                    # Deduplicate while preserving order (for primitives)
-                    seen = set()
-                    deduplicated = []
-                    for item in combined:
-                        # For unhashable items (dicts/lists), skip deduplication
-                        if isinstance(item, (dict, list)):
-                            deduplicated.append(item)
-                        else:
-                            if item not in seen:
-                                seen.add(item)
+        # One interned name per merge call: value_sources stores it for
+        # every new key, so duplicates would otherwise pile up
+        item_name = sys.intern(item_name)
+
+        stack = [(target, source, tuple(path))]
+        while stack:
+            tgt, src, pth = stack.pop()
+            for key, value in src.items():
+                current_path = pth + (key,)
+
+                if key in tgt:
+                    existing = tgt[key]
+                    # Same object - nothing to merge or report. Common
+                    # when items share a cached default fragment.
+                    if existing is value:
+                        continue
+                    # Key already exists - check for conflict
+                    if isinstance(existing, dict) and isinstance(value, dict):
+                        # Equal small subtrees need no merge; cap the
+                        # comparison so huge dicts don't pay for it
+                        if len(existing) < 16 and existing == value:
+                            continue
+                        # Both are dicts - copy this level so shared
+                        # input fragments are never mutated, then queue
+                        # the pair for merging
+                        node = dict(existing)
+                        tgt[key] = node
+                        stack.append((node, value, current_path))
+                    elif isinstance(existing, list) and isinstance(value, list):
+                        # Both are lists - concatenate and deduplicate
+                        combined = existing + value
+                        # Deduplicate while preserving order (for primitives)
+                        seen = set()
+                        deduplicated = []
+                        for item in combined:
+                            # For unhashable items (dicts/lists), skip deduplication
+                            if isinstance(item, (dict, list)):
                                 deduplicated.append(item)
-                    target[key] = deduplicated
-                    value_sources[path_key] = f"{value_sources.get(path_key, 'unknown')}, {item_name}"
-                else:
-                    # Values are not both dicts or both lists - potential conflict
-                    if target[key] != value:
-                        # Record conflict
-                        previous_source = value_sources.get(path_key, "unknown")
-                        conflict = Conflict(
-                            path=current_path,
-                            item_a=previous_source,
-                            item_b=item_name,
-                            value_a=target[key],
-                            value_b=value
+                            else:
+                                if item not in seen:
+                                    seen.add(item)
+                                    deduplicated.append(item)
+                        tgt[key] = deduplicated
+                        value_sources[current_path] = (
+                            f"{value_sources.get(current_path, 'unknown')}, {item_name}"
                         )
-                        conflicts.append(conflict)
-
-                    # Last value wins
-                    target[key] = deepcopy(value)
-                    value_sources[path_key] = item_name
-            else:
-                # New key - add it
-                target[key] = deepcopy(value)
-                value_sources[path_key] = item_name
+                    else:
+                        # Values are not both dicts or both lists - potential conflict
+                        if existing != value:
+                            # Record conflict
+                            previous_source = value_sources.get(current_path, "unknown")
+                            conflict = Conflict(
+                                path=current_path,
+                                item_a=previous_source,
+                                item_b=item_name,
+                                value_a=existing,
+                                value_b=value
+                            )
+                            conflicts.append(conflict)
+
+                        # Last value wins
+                        tgt[key] = value
+                        value_sources[current_path] = item_name
+                else:
+                    # New key - add it by reference
+                    tgt[key] = value
+                    value_sources[current_path] = item_name
 
     @staticmethod
     def detect_conflicts_only(
@@ -208,6 +266,25 @@ class JSONMerger:
         )
         return conflicts
 
+    @staticmethod
+    def build_mcp_fragments(
+        items: List[RegistryItem]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Map item names to their MCP fragments.
+
+        Args:
+            items: Registry items (items without a fragment are skipped)
+
+        Returns:
+            Dictionary mapping item names to MCP fragments, suitable for
+            merge_mcp_fragments and merge_with_item_names
+        """
+        return {
+            item.name: item.mcp_fragment
+            for item in items
+            if item.mcp_fragment
+        }
+
     @staticmethod
     def merge_mcp_fragments(
         item_fragments: Dict[str, Dict[str, Any]],
@@ -221,17 +298,16 @@ class JSONMerger:
 
         Returns:
             Tuple of (merged_config, conflicts_list)
-        """
-        # Validate all fragments have mcpServers key
-        for item_name, fragment in item_fragments.items():
-            if "mcpServers" not in fragment:
-                raise MergeError(
-                    f"MCP fragment from '{item_name}' missing 'mcpServers' key"
-                )
 
+        Raises:
+            MergeError: If a fragment is missing the 'mcpServers' key
+        """
+        # mcpServers validation happens inside the merge loop - one
+        # pass over the fragments instead of two
         return JSONMerger.merge_with_item_names(
             item_fragments,
-            detect_conflicts=detect_conflicts
+            detect_conflicts=detect_conflicts,
+            require_key="mcpServers"
         )
 
     @staticmethod
@@ -240,14 +316,52 @@ class JSONMerger:
     ) -> bool:
         """Check if merging would produce conflicts.
 
+        Stops at the first conflicting leaf instead of running the full
+        merge and materializing every conflict - the answer here is only
+        yes or no.
+
         Args:
             item_fragments: Dictionary mapping item names to fragments
 
         Returns:
             True if conflicts detected, False otherwise
         """
-        conflicts = JSONMerger.detect_conflicts_only(item_fragments)
-        return len(conflicts) > 0
+        shadow = {}
+        try:
+            for fragment in item_fragments.values():
+                JSONMerger._scan_conflicts(shadow, fragment)
+        except _ConflictFound:
+            return True
+        return False
+
+    @staticmethod
+    def _scan_conflicts(target: Dict, source: Dict):
+        """Merge source into a shadow tree, raising on the first conflict.
+
+        Mirrors _merge_with_tracking's merge rules but keeps no source
+        or conflict bookkeeping.
+
+        Raises:
+            _ConflictFound: On the first conflicting leaf
+        """
+        stack = [(target, source)]
+        while stack:
+            tgt, src = stack.pop()
+            for key, value in src.items():
+                if key not in tgt:
+                    tgt[key] = value
+                    continue
+                existing = tgt[key]
+                if existing is value:
+                    continue
+                if isinstance(existing, dict) and isinstance(value, dict):
+                    node = dict(existing)
+                    tgt[key] = node
+                    stack.append((node, value))
+                elif isinstance(existing, list) and isinstance(value, list):
+                    continue  # Lists concatenate; never a conflict
+                elif existing != value:
+                    raise _ConflictFound()
 
     @staticmethod
     def get_conflict_paths(
@@ -1,11 +1,17 @@
 """Registry metadata loader for parsing YAML files."""
 
 import os
-import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml, ~10x faster
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # Pure-Python fallback
+
 from src.registry.models import RegistryItem, EnvVar, ItemType
 
 
@@ -14,6 +20,22 @@ class RegistryLoadError(Exception):
     pass
 
 
+class RegistryIndex:
+    """Inverted type and tag indexes over a loaded item list.
+
+    RegistryItem is not hashable, so the indexes hold lists in load
+    order and membership checks go through id() sets.
+    """
+
+    def __init__(self, items: List[RegistryItem]):
+        self.by_type: Dict[ItemType, List[RegistryItem]] = {}
+        self.by_tag: Dict[str, List[RegistryItem]] = {}
+        for item in items:
+            self.by_type.setdefault(item.type, []).append(item)
+            for tag in item.tags:
+                self.by_tag.setdefault(tag, []).append(item)
+
+
 class RegistryLoader:
     """Loader for registry metadata from YAML files."""
 
@@ -28,6 +50,11 @@ class RegistryLoader:
             raise RegistryLoadError(
                 f"Registry not found at: {registry_path}"
             )
+        # Populated by the first load_all so find_item is a dict lookup
+        # instead of a full re-read of the registry per call
+        self._all_items: Optional[List[RegistryItem]] = None
+        self._by_name: Dict[str, RegistryItem] = {}
+        self._index: Optional[RegistryIndex] = None
 
     def load_item(self, namespace: str, item_name: str) -> RegistryItem:
         """Load a single registry item from metadata.yaml.
@@ -46,14 +73,16 @@ class RegistryLoader:
             self.registry_path / namespace / item_name / "metadata.yaml"
         )
 
-        if not metadata_path.exists():
+        try:
+            # Binary mode: both parsers accept bytes, skipping the
+            # text-mode decoder layer. A missing file surfaces from
+            # open itself - no exists-then-open stat or race
+            with open(metadata_path, 'rb') as f:
+                data = yaml.load(f, Loader=_YamlLoader)
+        except FileNotFoundError:
             raise RegistryLoadError(
                 f"Metadata not found: {metadata_path}"
             )
-
-        try:
-            with open(metadata_path, 'r') as f:
-                data = yaml.safe_load(f)
         except yaml.YAMLError as e:
             raise RegistryLoadError(
                 f"Invalid YAML in {metadata_path}: {e}"
@@ -95,26 +124,29 @@ class RegistryLoader:
                     default=env_data.get("default")
                 ))
 
-            # Load MCP fragment if present
-            mcp_fragment = None
+            # Point at the fragment file; RegistryItem validates its
+            # existence and parses the JSON lazily on first access
+            mcp_fragment_path = None
             if data.get("type") == "mcp":
                 mcp_fragment_path = metadata_path.parent / "mcp-fragment.json"
-                if mcp_fragment_path.exists():
-                    with open(mcp_fragment_path, 'r') as f:
-                        mcp_fragment = json.load(f)
 
-            # Create RegistryItem
+            # Create RegistryItem. Names, tags and dependency names
+            # recur across items and dependency graphs - intern them so
+            # duplicates collapse to one object and dict/set lookups
+            # take the identity fast path
             return RegistryItem(
-                name=data["name"],
+                name=sys.intern(data["name"]),
                 version=data["version"],
                 type=ItemType(data["type"]),
                 category=data.get("category"),
-                tags=data.get("tags", []),
+                tags=[sys.intern(t) for t in data.get("tags", [])],
                 description=data["description"],
-                dependencies=data.get("dependencies", []),
+                dependencies=[
+                    sys.intern(d) for d in data.get("dependencies", [])
+                ],
                 env_vars=env_vars,
                 files=data["files"],
-                mcp_fragment=mcp_fragment,
+                mcp_fragment_path=mcp_fragment_path,
                 compatibility_notes=data.get("compatibility_notes")
             )
 
@@ -144,40 +176,68 @@ class RegistryLoader:
             RegistryLoadError: If namespace not found
         """
         namespace_path = self.registry_path / namespace
-        if not namespace_path.exists():
+
+        # scandir reads the entry type from the directory listing, so
+        # filtering to directories costs no stat call per entry
+        try:
+            with os.scandir(namespace_path) as it:
+                item_names = [
+                    entry.name
+                    for entry in it
+                    if entry.is_dir(follow_symlinks=False)
+                ]
+        except (FileNotFoundError, NotADirectoryError):
             raise RegistryLoadError(
                 f"Namespace not found: {namespace_path}"
             )
 
+        # Loading is many small reads that release the GIL, so overlap
+        # them across threads; futures are consumed in submission order
+        # to keep item order (and warning order) deterministic
         items = []
-        for item_dir in namespace_path.iterdir():
-            if item_dir.is_dir():
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.load_item, namespace, name)
+                for name in item_names
+            ]
+            for name, future in zip(item_names, futures):
                 try:
-                    item = self.load_item(namespace, item_dir.name)
-                    items.append(item)
+                    items.append(future.result())
                 except RegistryLoadError as e:
                     # Log warning but continue loading other items
-                    print(f"Warning: Failed to load {item_dir.name}: {e}")
+                    print(f"Warning: Failed to load {name}: {e}")
 
         return items
 
     def load_all(self) -> List[RegistryItem]:
         """Load all items from all namespaces.
 
+        Results are cached on the instance: the first call reads and
+        parses every metadata file, later calls return the same list.
+
         Returns:
             List of all RegistryItem instances
 
         Raises:
             RegistryLoadError: If registry structure is invalid
         """
+        if self._all_items is not None:
+            return self._all_items
+
         items = []
-        namespaces = ["subagents", "commands", "mcp"]
+        namespaces = [item_type.namespace for item_type in ItemType]
 
         for namespace in namespaces:
-            namespace_path = self.registry_path / namespace
-            if namespace_path.exists():
+            try:
                 items.extend(self.load_namespace(namespace))
+            except RegistryLoadError:
+                # Namespace directory absent - nothing to load
+                continue
 
+        self._all_items = items
+        self._by_name = {item.name: item for item in items}
+        self._index = RegistryIndex(items)
         return items
 
     def find_item(self, name: str) -> Optional[RegistryItem]:
@@ -189,10 +249,9 @@ class RegistryLoader:
         Returns:
             RegistryItem if found, None otherwise
         """
-        for item in self.load_all():
-            if item.name == name:
-                return item
-        return None
+        if self._all_items is None:
+            self.load_all()
+        return self._by_name.get(name)
 
     def filter_by_tags(
         self,
@@ -211,12 +270,23 @@ class RegistryLoader:
         if not tags:
             return items
 
-        filtered = []
-        for item in items:
-            if any(tag in item.tags for tag in tags):
-                filtered.append(item)
-
-        return filtered
+        # For the indexed full list, one id-set membership test per
+        # item replaces a scan of every item's tag list per requested
+        # tag; other lists (not guaranteed indexed) stay linear
+        if self._index is not None and items is self._all_items:
+            matched = {
+                id(item)
+                for tag in tags
+                for item in self._index.by_tag.get(tag, ())
+            }
+            return [item for item in items if id(item) in matched]
+
+        # Set intersection per item instead of a nested list scan
+        query = frozenset(tags)
+        return [
+            item for item in items
+            if not item._tag_set.isdisjoint(query)
+        ]
 
     def filter_by_type(
         self,
@@ -232,4 +302,8 @@ class RegistryLoader:
         Returns:
             List of items matching the type
         """
+        # The full item list is the common input - answer it straight
+        # from the index instead of re-scanning
+        if self._index is not None and items is self._all_items:
+            return list(self._index.by_type.get(item_type, ()))
         return [item for item in items if item.type == item_type]
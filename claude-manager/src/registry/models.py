@@ -1,10 +1,24 @@
 """Data models for registry items and environment variables."""
 
+import json
 import re
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
+
+# Compiled once at import: __post_init__ re-runs these for every item
+# and env var each time a registry is loaded
+_ENV_NAME_RE = re.compile(r'^[A-Z_][A-Z0-9_]*$')
+_ITEM_NAME_RE = re.compile(r'^[a-z0-9-]+$')
+_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+')
+
 
 class ItemType(Enum):
     """Types of registry items."""
@@ -12,8 +26,24 @@ class ItemType(Enum):
     COMMAND = "command"
     MCP = "mcp"
 
+    @property
+    def namespace(self) -> str:
+        """Registry directory name for this item type.
+
+        The loader and copier must agree on this layout; note the mcp
+        namespace is not pluralized.
+        """
+        return _NAMESPACE_BY_TYPE[self]
+
+
+_NAMESPACE_BY_TYPE = {
+    ItemType.SUBAGENT: "subagents",
+    ItemType.COMMAND: "commands",
+    ItemType.MCP: "mcp",
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EnvVar:
     """Environment variable required by a registry item.
 
@@ -30,14 +60,14 @@ class EnvVar:
 
     def __post_init__(self):
         """Validate environment variable name format."""
-        if not re.match(r'^[A-Z_][A-Z0-9_]*$', self.name):
+        if not _ENV_NAME_RE.match(self.name):
             raise ValueError(
                 f"Invalid env var name '{self.name}'. "
                 "Must match pattern: ^[A-Z_][A-Z0-9_]*$"
             )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RegistryItem:
     """Registry item (sub-agent, command, or MCP server).
 
@@ -51,7 +81,9 @@ class RegistryItem:
         dependencies: Names of other registry items required
         env_vars: Environment variables required by this item
         files: Map of destination paths to source paths in registry
-        mcp_fragment: Partial .mcp.json structure (only for type="mcp")
+        mcp_fragment_path: On-disk location of the item's mcp-fragment.json;
+            the parsed fragment is exposed lazily through the
+            mcp_fragment property (only for type="mcp")
         compatibility_notes: Version constraints or warnings
     """
     name: str
@@ -63,20 +95,31 @@ class RegistryItem:
     category: Optional[str] = None
     dependencies: List[str] = field(default_factory=list)
     env_vars: List[EnvVar] = field(default_factory=list)
-    mcp_fragment: Optional[Dict[str, Any]] = None
+    mcp_fragment_path: Optional[Path] = field(default=None, repr=False)
     compatibility_notes: Optional[str] = None
+    _mcp_fragment: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    required_env_vars: List[EnvVar] = field(init=False, repr=False)
+    optional_env_vars: List[EnvVar] = field(init=False, repr=False)
+    _tag_set: frozenset = field(init=False, repr=False)
 
     def __post_init__(self):
         """Validate registry item constraints."""
+        # Normalize string type to enum first: the MCP checks below
+        # compare against ItemType members, and enum equality is always
+        # False across types, so a string type would slip past them
+        # (frozen dataclasses write through object.__setattr__)
+        if isinstance(self.type, str):
+            object.__setattr__(self, 'type', ItemType(self.type))
+
         # Validate name format
-        if not re.match(r'^[a-z0-9-]+$', self.name):
+        if not _ITEM_NAME_RE.match(self.name):
             raise ValueError(
                 f"Invalid item name '{self.name}'. "
                 "Must match pattern: ^[a-z0-9-]+$"
             )
 
         # Validate version is semver-like
-        if not re.match(r'^\d+\.\d+\.\d+', self.version):
+        if not _VERSION_RE.match(self.version):
             raise ValueError(
                 f"Invalid version '{self.version}'. "
                 "Must be valid semver (e.g., '2.1.0')"
@@ -86,19 +129,54 @@ class RegistryItem:
         if not self.files:
             raise ValueError(f"Item '{self.name}' must have at least one file")
 
-        # Validate mcp_fragment required if and only if type is MCP
-        if self.type == ItemType.MCP and self.mcp_fragment is None:
+        # Validate mcp_fragment required if and only if type is MCP.
+        # Only the fragment file's existence is checked here; its
+        # contents are parsed lazily on first mcp_fragment access
+        has_fragment = self._mcp_fragment is not None or (
+            self.mcp_fragment_path is not None
+            and self.mcp_fragment_path.exists()
+        )
+        if self.type == ItemType.MCP and not has_fragment:
             raise ValueError(
                 f"Item '{self.name}' has type 'mcp' but no mcp_fragment"
             )
-        if self.type != ItemType.MCP and self.mcp_fragment is not None:
+        if self.type != ItemType.MCP and (
+            self._mcp_fragment is not None
+            or self.mcp_fragment_path is not None
+        ):
             raise ValueError(
                 f"Item '{self.name}' has mcp_fragment but type is not 'mcp'"
             )
 
-        # Convert string type to enum if needed
-        if isinstance(self.type, str):
-            self.type = ItemType(self.type)
+        # Partition env vars once so the getters do not re-filter per call
+        object.__setattr__(
+            self, 'required_env_vars',
+            [env for env in self.env_vars if env.required]
+        )
+        object.__setattr__(
+            self, 'optional_env_vars',
+            [env for env in self.env_vars if not env.required]
+        )
+
+        # Frozen set of tags so filters test membership at C speed
+        object.__setattr__(self, '_tag_set', frozenset(self.tags))
+
+    @property
+    def mcp_fragment(self) -> Optional[Dict[str, Any]]:
+        """Parsed .mcp.json fragment, read from disk on first access.
+
+        Listing and filtering workflows never touch fragments, so
+        load_all skips the JSON read entirely; only items actually
+        being installed pay for the parse, and only once.
+        """
+        if self._mcp_fragment is None and self.mcp_fragment_path is not None:
+            with open(self.mcp_fragment_path, 'rb') as f:
+                if orjson is not None:
+                    fragment = orjson.loads(f.read())
+                else:
+                    fragment = json.load(f)
+            object.__setattr__(self, '_mcp_fragment', fragment)
+        return self._mcp_fragment
 
     @property
     def full_name(self) -> str:
@@ -115,8 +193,8 @@ class RegistryItem:
 
     def get_required_env_vars(self) -> List[EnvVar]:
         """Get list of required environment variables."""
-        return [env for env in self.env_vars if env.required]
+        return self.required_env_vars
 
     def get_optional_env_vars(self) -> List[EnvVar]:
         """Get list of optional environment variables."""
-        return [env for env in self.env_vars if not env.required]
+        return self.optional_env_vars
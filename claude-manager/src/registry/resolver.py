@@ -1,7 +1,7 @@
 """Dependency graph builder and resolver with cycle detection."""
 
-from typing import List, Dict, Set, Optional
-from collections import defaultdict
+from typing import List, Dict, Set, Optional, Tuple
+from collections import defaultdict, deque
 
 from src.registry.models import RegistryItem
 
@@ -24,17 +24,19 @@ class MissingDependencyError(DependencyError):
 class DependencyGraph:
     """Dependency graph for resolving item dependencies.
 
-    Uses adjacency list representation and DFS-based topological sort
-    with cycle detection.
+    Uses adjacency list representation and an iterative Kahn
+    topological sort with cycle detection.
     """
 
     def __init__(self):
         """Initialize empty dependency graph."""
         self.nodes: Dict[str, RegistryItem] = {}
         self.edges: Dict[str, List[str]] = defaultdict(list)
+        self.in_degree: Dict[str, int] = defaultdict(int)
         self.visited: Set[str] = set()
         self.visiting: Set[str] = set()
         self._sorted: List[RegistryItem] = []
+        self._trans_cache: Dict[str, tuple] = {}
 
     def add_item(self, item: RegistryItem):
         """Add item to dependency graph.
@@ -46,9 +48,14 @@ class DependencyGraph:
         # Initialize edges list even if no dependencies
         if item.name not in self.edges:
             self.edges[item.name] = []
-        # Add dependency edges
+        # Add dependency edges; in_degree counts how many items depend
+        # on a node, maintained here so resolve() need not rescan
         for dep_name in item.dependencies:
             self.edges[item.name].append(dep_name)
+            self.in_degree[dep_name] += 1
+        # New edges can extend any previously computed closure
+        if self._trans_cache:
+            self._trans_cache.clear()
 
     def add_items(self, items: List[RegistryItem]):
         """Add multiple items to dependency graph.
@@ -157,51 +164,41 @@ class DependencyGraph:
                 f"Missing dependencies:\n{error_msg}"
             )
 
-        # Reset state for topological sort
-        self.visited = set()
-        self.visiting = set()
+        # Kahn's algorithm: start from nodes nothing depends on and
+        # peel inward, decrementing dependency in-degrees. Iterative,
+        # O(V+E), no recursion depth limit, and the output keeps the
+        # dependents-before-dependencies order the DFS version produced
+        remaining = {
+            name: self.in_degree.get(name, 0) for name in self.nodes
+        }
+        queue = deque(
+            name for name, degree in remaining.items() if degree == 0
+        )
         self._sorted = []
-
-        # Run DFS on all nodes
-        for node in self.nodes:
-            if node not in self.visited:
-                self._dfs_topological_sort(node)
-
-        # Reverse to get correct dependency order (dependencies first)
-        self._sorted.reverse()
-
-        return self._sorted
-
-    def _dfs_topological_sort(self, node: str):
-        """DFS-based topological sort with cycle detection.
-
-        Args:
-            node: Current node name
-
-        Raises:
-            CircularDependencyError: If cycle detected
-        """
-        if node in self.visiting:
-            # Build cycle path
+        while queue:
+            name = queue.popleft()
+            self._sorted.append(self.nodes[name])
+            for dep in self.edges.get(name, ()):
+                remaining[dep] -= 1
+                if remaining[dep] == 0:
+                    queue.append(dep)
+
+        if len(self._sorted) < len(self.nodes):
+            # Every unprocessed node sits on (or behind) a cycle; run
+            # the DFS cycle finder over them for a path in the error
+            self.visited = set()
+            self.visiting = set()
+            leftover = [
+                name for name in self.nodes if remaining[name] > 0
+            ]
+            for node in leftover:
+                if node not in self.visited:
+                    self._dfs_cycle_detection(node, [])
             raise CircularDependencyError(
-                f"Circular dependency detected involving: {node}"
+                f"Circular dependency detected involving: {leftover[0]}"
             )
 
-        if node in self.visited:
-            return
-
-        self.visiting.add(node)
-
-        # Visit dependencies first
-        for dep in self.edges.get(node, []):
-            if dep in self.nodes:
-                self._dfs_topological_sort(dep)
-
-        self.visiting.remove(node)
-        self.visited.add(node)
-
-        # Add to sorted list after all dependencies processed
-        self._sorted.append(self.nodes[node])
+        return self._sorted
 
     def _check_missing_dependencies(self) -> Dict[str, List[str]]:
         """Check for missing dependencies.
@@ -235,23 +232,87 @@ class DependencyGraph:
         if item_name not in self.nodes:
             raise KeyError(f"Item '{item_name}' not in dependency graph")
 
-        # Build subgraph with only this item and its dependencies
-        subgraph = DependencyGraph()
-        self._collect_dependencies(item_name, subgraph)
+        closure = self._transitive_closure(item_name)
+        if not closure:
+            return []
 
-        # Resolve subgraph
-        try:
-            resolved = subgraph.resolve()
-            # Remove the original item from result (only return dependencies)
-            return [item for item in resolved if item.name != item_name]
-        except CircularDependencyError:
-            raise
-        except MissingDependencyError:
-            # Re-raise with more context
+        if any(name not in self.nodes for name in closure):
             raise DependencyError(
                 f"Item '{item_name}' has missing dependencies"
             )
 
+        # Order the closure with a Kahn sort restricted to it - no
+        # subgraph object is built, just in-degrees over the subset
+        subset = [item_name, *closure]
+        subset_set = set(subset)
+        degrees = {name: 0 for name in subset}
+        for name in subset:
+            for dep in self.nodes[name].dependencies:
+                if dep in subset_set:
+                    degrees[dep] += 1
+
+        queue = deque(
+            name for name in subset if degrees[name] == 0
+        )
+        ordered = []
+        while queue:
+            name = queue.popleft()
+            ordered.append(name)
+            for dep in self.nodes[name].dependencies:
+                if dep in subset_set:
+                    degrees[dep] -= 1
+                    if degrees[dep] == 0:
+                        queue.append(dep)
+
+        if len(ordered) < len(subset):
+            raise CircularDependencyError(
+                f"Circular dependency detected involving: {item_name}"
+            )
+
+        # Remove the original item from result (only return dependencies)
+        return [
+            self.nodes[name] for name in ordered if name != item_name
+        ]
+
+    def _transitive_closure(self, root: str) -> tuple:
+        """Names of all direct and transitive dependencies of root.
+
+        Results are memoized per node and composed from already cached
+        neighbors, so overlapping selections walk each shared subtree
+        once per graph instead of once per query. The cache is cleared
+        whenever an item is added.
+
+        Args:
+            root: Node name to start from (excluded from the result)
+
+        Returns:
+            Dependency names in first-discovery order
+        """
+        cached = self._trans_cache.get(root)
+        if cached is not None:
+            return cached
+
+        # Dict used as an ordered set; names missing from the graph are
+        # kept so callers can report them
+        closure: Dict[str, None] = {}
+        stack = list(reversed(self.nodes[root].dependencies))
+        while stack:
+            name = stack.pop()
+            if name in closure or name == root:
+                continue
+            closure[name] = None
+            sub = self._trans_cache.get(name)
+            if sub is not None:
+                for dep in sub:
+                    if dep != root:
+                        closure.setdefault(dep, None)
+            elif name in self.nodes:
+                stack.extend(reversed(self.nodes[name].dependencies))
+
+        result = tuple(closure)
+        self._trans_cache[root] = result
+        return result
+
     def _collect_dependencies(
         self,
         node: str,
@@ -287,7 +348,7 @@ class DependencyResolver:
     def resolve_dependencies(
         selected_items: List[RegistryItem],
         available_items: List[RegistryItem]
-    ) -> List[RegistryItem]:
+    ) -> Tuple[List[RegistryItem], List[RegistryItem]]:
         """Resolve dependencies for selected items.
 
         Args:
@@ -295,32 +356,82 @@ class DependencyResolver:
             available_items: All available items in registry
 
         Returns:
-            List of all items (selected + dependencies) in dependency order
+            Tuple of (all items in dependency order, items that were
+            pulled in as dependencies rather than selected)
 
         Raises:
             CircularDependencyError: If cycle detected
             MissingDependencyError: If required dependency not available
         """
-        # Build graph with all available items
-        graph = DependencyGraph()
-        graph.add_items(available_items)
+        # Plain dicts stand in for graph objects here: one closure walk
+        # over the selection, then one Kahn sort restricted to the
+        # needed names. No intermediate DependencyGraph instances.
+        items_by_name = {item.name: item for item in available_items}
+        selected_names = {item.name for item in selected_items}
 
-        # Collect all items we need (selected + dependencies)
-        needed_items = set()
         for item in selected_items:
-            needed_items.add(item.name)
-            # Get transitive dependencies
-            deps = graph.get_transitive_dependencies(item.name)
-            for dep in deps:
-                needed_items.add(dep.name)
-
-        # Build final graph with only needed items
-        final_graph = DependencyGraph()
-        for name in needed_items:
-            final_graph.add_item(graph.nodes[name])
-
-        # Resolve in dependency order
-        return final_graph.resolve()
+            if item.name not in items_by_name:
+                raise KeyError(
+                    f"Item '{item.name}' not in dependency graph"
+                )
+
+        # Iterative DFS collecting every needed name once, noting any
+        # dependency that is not available
+        needed: Dict[str, None] = {}
+        missing: Dict[str, List[str]] = {}
+        stack = [item.name for item in reversed(selected_items)]
+        while stack:
+            name = stack.pop()
+            if name in needed:
+                continue
+            needed[name] = None
+            for dep in reversed(items_by_name[name].dependencies):
+                if dep in items_by_name:
+                    stack.append(dep)
+                else:
+                    missing.setdefault(name, []).insert(0, dep)
+
+        if missing:
+            error_msg = "\n".join(
+                f"  - {item} requires missing dependency: {dep}"
+                for item, deps in missing.items()
+                for dep in deps
+            )
+            raise MissingDependencyError(
+                f"Missing dependencies:\n{error_msg}"
+            )
+
+        # Kahn sort over the needed subset, dependents first
+        degrees = {name: 0 for name in needed}
+        for name in needed:
+            for dep in items_by_name[name].dependencies:
+                degrees[dep] += 1
+        queue = deque(
+            name for name in needed if degrees[name] == 0
+        )
+        resolved_items = []
+        while queue:
+            name = queue.popleft()
+            resolved_items.append(items_by_name[name])
+            for dep in items_by_name[name].dependencies:
+                degrees[dep] -= 1
+                if degrees[dep] == 0:
+                    queue.append(dep)
+
+        if len(resolved_items) < len(needed):
+            leftover = next(
+                name for name in needed if degrees[name] > 0
+            )
+            raise CircularDependencyError(
+                f"Circular dependency detected involving: {leftover}"
+            )
+
+        # Partition out the items resolution added so callers do not
+        # re-derive them
+        dep_items = [
+            item for item in resolved_items if item.name not in selected_names
+        ]
+        return resolved_items, dep_items
 
     @staticmethod
     def check_cycles(items: List[RegistryItem]) -> Optional[List[str]]:
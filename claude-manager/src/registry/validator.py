@@ -1,10 +1,21 @@
 """Registry item validator for metadata schema validation."""
 
 import re
+from collections import Counter
 from typing import List, Tuple
 from src.registry.models import RegistryItem, EnvVar, ItemType
 
 
+# Compiled once: validate_items runs these per field per item, and the
+# dependency loop hits the name pattern once per listed dependency.
+# Whole-string patterns are unanchored and checked with fullmatch,
+# which skips the anchor machinery; the version check is a prefix
+# match and keeps using match
+_NAME_RE = re.compile(r'[a-z0-9-]+')
+_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+')
+_ENV_NAME_RE = re.compile(r'[A-Z_][A-Z0-9_]*')
+
+
 class ValidationError(Exception):
     """Exception raised when validation fails."""
     pass
@@ -26,13 +37,13 @@ class RegistryValidator:
         errors = []
 
         # Validate name format
-        if not re.match(r'^[a-z0-9-]+$', item.name):
+        if not _NAME_RE.fullmatch(item.name):
             errors.append(
                 f"Invalid name '{item.name}': must match ^[a-z0-9-]+$"
             )
 
         # Validate version format
-        if not re.match(r'^\d+\.\d+\.\d+', item.version):
+        if not _VERSION_RE.match(item.version):
             errors.append(
                 f"Invalid version '{item.version}': must be semver (e.g., '2.1.0')"
             )
@@ -85,7 +96,7 @@ class RegistryValidator:
 
         # Validate dependencies format
         for dep in item.dependencies:
-            if not re.match(r'^[a-z0-9-]+$', dep):
+            if not _NAME_RE.fullmatch(dep):
                 errors.append(
                     f"Invalid dependency name '{dep}': must match ^[a-z0-9-]+$"
                 )
@@ -105,7 +116,7 @@ class RegistryValidator:
         errors = []
 
         # Validate name format
-        if not re.match(r'^[A-Z_][A-Z0-9_]*$', env.name):
+        if not _ENV_NAME_RE.fullmatch(env.name):
             errors.append(
                 f"Invalid env var name '{env.name}': must match ^[A-Z_][A-Z0-9_]*$"
             )
@@ -211,15 +222,9 @@ class RegistryValidator:
         Returns:
             List of duplicate names (empty if no duplicates)
         """
-        seen = set()
-        duplicates = []
-
-        for item in items:
-            if item.name in seen:
-                duplicates.append(item.name)
-            seen.add(item.name)
-
-        return duplicates
+        # Counting runs in C; each duplicated name is reported once
+        counts = Counter(item.name for item in items)
+        return [name for name, count in counts.items() if count > 1]
 
     @staticmethod
     def check_missing_dependencies(items: List[RegistryItem]) -> dict:
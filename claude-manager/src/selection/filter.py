@@ -27,21 +27,21 @@ class ItemFilter:
         if not tags:
             return items
 
-        filtered = []
-        for item in items:
-            item_tags = set(item.tags)
-            filter_tags = set(tags)
-
-            if match_all:
-                # AND logic: item must have all specified tags
-                if filter_tags.issubset(item_tags):
-                    filtered.append(item)
-            else:
-                # OR logic: item must have at least one specified tag
-                if filter_tags.intersection(item_tags):
-                    filtered.append(item)
-
-        return filtered
+        # One query set for the whole call; items carry a precomputed
+        # _tag_set, so each test is a single C-level set operation
+        filter_tags = frozenset(tags)
+
+        if match_all:
+            # AND logic: item must have all specified tags
+            return [
+                item for item in items
+                if filter_tags <= item._tag_set
+            ]
+        # OR logic: item must have at least one specified tag
+        return [
+            item for item in items
+            if not filter_tags.isdisjoint(item._tag_set)
+        ]
 
     @staticmethod
     def by_type(
@@ -216,21 +216,30 @@ class ItemFilter:
         Returns:
             Filtered list of items
         """
-        result = items
-
-        if tags:
-            result = ItemFilter.by_tags(result, tags, match_all=match_all_tags)
-
-        if item_type:
-            result = ItemFilter.by_type(result, item_type)
-
-        if category:
-            result = ItemFilter.by_category(result, category)
-
-        if search:
-            result = ItemFilter.by_search(result, search)
+        # All predicates evaluate inline in one pass - no intermediate
+        # list per active filter. Inputs are normalized once up front
+        filter_tags = frozenset(tags) if tags else None
+        category_lower = category.lower() if category else None
+        search_lower = search.lower() if search else None
+
+        if (filter_tags is None and item_type is None
+                and category_lower is None and search_lower is None):
+            return items
 
-        return result
+        return [
+            item for item in items
+            if (filter_tags is None
+                or (filter_tags <= item._tag_set if match_all_tags
+                    else not filter_tags.isdisjoint(item._tag_set)))
+            and (item_type is None or item.type == item_type)
+            and (category_lower is None
+                 or (item.category is not None
+                     and item.category.lower() == category_lower))
+            and (search_lower is None
+                 or search_lower in item.name.lower()
+                 or search_lower in item.description.lower()
+                 or any(search_lower in tag.lower() for tag in item.tags))
+        ]
 
     @staticmethod
     def get_available_tags(items: List[RegistryItem]) -> List[str]:
@@ -1,7 +1,7 @@
 """Data models for item selection and conflicts."""
 
 from dataclasses import dataclass, field
-from typing import List, Any, Optional
+from typing import Any, List, Optional, Sequence
 from src.registry.models import RegistryItem
 
 
@@ -10,22 +10,29 @@ class Conflict:
     """Configuration key collision during merge.
 
     Attributes:
-        path: JSON path to conflicting key (e.g., ["mcpServers", "serena", "command"])
+        path: JSON path to conflicting key (e.g., ("mcpServers", "serena",
+            "command")); accepts any sequence of keys, stored as a tuple
         item_a: Name of first item defining this key
         item_b: Name of second item defining this key
         value_a: Value from item_a
         value_b: Value from item_b
     """
-    path: List[str]
+    path: Sequence[str]
     item_a: str
     item_b: str
     value_a: Any
     value_b: Any
+    _path_str: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Normalize the path and join its display form once."""
+        self.path = tuple(self.path)
+        self._path_str = ".".join(self.path)
 
     @property
     def path_str(self) -> str:
         """Return path as dot-separated string."""
-        return ".".join(self.path)
+        return self._path_str
 
     def __str__(self) -> str:
         """Return human-readable conflict description."""
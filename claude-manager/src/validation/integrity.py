@@ -7,6 +7,16 @@ from pathlib import Path
 from typing import Optional, Callable
 from contextlib import contextmanager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None  # Fall back to SHA-256
+
 
 class AtomicOperationError(Exception):
     """Exception raised when atomic operation fails."""
@@ -175,13 +185,19 @@ class FileOperation:
         Raises:
             AtomicOperationError: If write fails
         """
-        import json
-
         try:
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2, sort_keys=sort_keys)
-                f.write('\n')  # Ensure newline at end
+            if orjson is not None:
+                option = orjson.OPT_INDENT_2
+                if sort_keys:
+                    option |= orjson.OPT_SORT_KEYS
+                # Ensure newline at end
+                file_path.write_bytes(orjson.dumps(data, option=option) + b'\n')
+            else:
+                import json
+                with open(file_path, 'w') as f:
+                    json.dump(data, f, indent=2, sort_keys=sort_keys)
+                    f.write('\n')  # Ensure newline at end
         except Exception as e:
             raise AtomicOperationError(
                 f"Failed to write JSON to {file_path}: {e}"
@@ -200,9 +216,10 @@ class FileOperation:
         Raises:
             AtomicOperationError: If read fails
         """
-        import json
-
         try:
+            if orjson is not None:
+                return orjson.loads(file_path.read_bytes())
+            import json
             with open(file_path, 'r') as f:
                 return json.load(f)
         except Exception as e:
@@ -237,6 +254,48 @@ class FileOperation:
                 f"Failed to compute hash for {file_path}: {e}"
             ) from e
 
+    @staticmethod
+    def compute_hash(file_path: Path, algo: str = "sha256") -> str:
+        """Compute file hash with the given algorithm.
+
+        BLAKE3 is noticeably faster than SHA-256 on large files; SHA-256
+        remains the default so existing lock files keep verifying.
+
+        Args:
+            file_path: Path to file
+            algo: Hash algorithm ("sha256" or "blake3")
+
+        Returns:
+            Hash string with '<algo>:' prefix
+
+        Raises:
+            AtomicOperationError: If computation fails or algorithm unavailable
+        """
+        if algo == "sha256":
+            return FileOperation.compute_sha256(file_path)
+
+        if algo != "blake3":
+            raise AtomicOperationError(
+                f"Unsupported hash algorithm: {algo}"
+            )
+        if blake3 is None:
+            raise AtomicOperationError(
+                "blake3 is not installed but the lock file uses it. "
+                "Install with: pip install blake3"
+            )
+
+        try:
+            hasher = blake3()
+            with open(file_path, 'rb') as f:
+                # Read in chunks to handle large files
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    hasher.update(chunk)
+            return f"blake3:{hasher.hexdigest()}"
+        except Exception as e:
+            raise AtomicOperationError(
+                f"Failed to compute hash for {file_path}: {e}"
+            ) from e
+
     @staticmethod
     def verify_sha256(file_path: Path, expected_hash: str) -> bool:
         """Verify SHA-256 hash of file.
@@ -1,5 +1,6 @@
 """JSON Schema validator for .mcp.json files."""
 
+import functools
 import json
 from pathlib import Path
 from typing import Dict, List, Tuple
@@ -186,3 +187,9 @@ class MCPSchemaValidator:
             return False
 
         return server_name in mcp_config["mcpServers"]
+
+
+@functools.lru_cache(maxsize=1)
+def _default_validator() -> MCPSchemaValidator:
+    """Return a process-wide validator so the schema is loaded once."""
+    return MCPSchemaValidator()